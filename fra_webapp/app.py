@@ -10,7 +10,9 @@ This application provides:
 """
 
 from flask import Flask, render_template, request, jsonify, send_file
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import functools
 import os
 import json
 import pandas as pd
@@ -18,10 +20,17 @@ from datetime import datetime
 import logging
 from werkzeug.utils import secure_filename
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    print("Warning: orjson not available, falling back to standard json")
+    ORJSON_AVAILABLE = False
+
 # Import custom modules
 from backend.ocr_processor import OCRProcessor
-from backend.gis_processor import GISProcessor
-from backend.decision_support import DecisionSupportSystem
+from backend.gis_processor import get_gis_processor
+from backend.decision_support import get_decision_support_system
 from backend.data_manager import DataManager
 
 # Configure logging
@@ -31,14 +40,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(JSONProvider):
+    """orjson-backed JSON provider - serializes large beneficiary payloads
+    in C and handles numpy scalars natively"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__)
 app.secret_key = 'fra_atlas_secret_key_2025'
 CORS(app)
 
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+
 # Configuration
 UPLOAD_FOLDER = 'uploads'
-ALLOWED_EXTENSIONS = {'pdf', 'png', 'jpg', 'jpeg', 'tiff', 'tif'}
+ALLOWED_EXTENSIONS = frozenset({'.pdf', '.png', '.jpg', '.jpeg', '.tiff', '.tif'})
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
@@ -47,23 +68,32 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 # Initialize processors
 ocr_processor = OCRProcessor()
-gis_processor = GISProcessor()
-decision_support = DecisionSupportSystem()
+gis_processor = get_gis_processor()
+decision_support = get_decision_support_system()
 data_manager = DataManager()
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return os.path.splitext(filename)[1].lower() in ALLOWED_EXTENSIONS
+
+def conditional_json(payload, etag):
+    """Build a JSON response with an ETag and honor If-None-Match
+
+    Read-only data only changes when the data manager reloads, so
+    polling clients get a bodyless 304 instead of a full payload.
+    """
+    response = jsonify(payload)
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 @app.route('/')
 def index():
     """Main landing page - Government portal style"""
     return render_template('index.html')
 
-@app.route('/atlas')
-def atlas():
-    """FRA Atlas - Interactive mapping portal"""
-    # Load Mapbox token
+@functools.lru_cache(maxsize=1)
+def load_mapbox_token():
+    """Load Mapbox token once - the token file is effectively constant"""
     try:
         with open('../webgis_utilities/token.txt', 'r') as f:
             lines = f.read().strip().split('\n')
@@ -78,10 +108,15 @@ def atlas():
             # Fallback if no public key found
             if not mapbox_token:
                 mapbox_token = lines[0].strip() if lines else 'pk.eyJ1IjoibjF6aGFsIiwiYSI6ImNtZjEweWx6YTA4MHcycnNpZWxhNnB0azQifQ.96gYt6yWCshqyVwye1P3Zw'
+            
+            return mapbox_token
     except:
-        mapbox_token = 'pk.eyJ1IjoibjF6aGFsIiwiYSI6ImNtZjEweWx6YTA4MHcycnNpZWxhNnB0azQifQ.96gYt6yWCshqyVwye1P3Zw'
-    
-    return render_template('atlas.html', mapbox_token=mapbox_token)
+        return 'pk.eyJ1IjoibjF6aGFsIiwiYSI6ImNtZjEweWx6YTA4MHcycnNpZWxhNnB0azQifQ.96gYt6yWCshqyVwye1P3Zw'
+
+@app.route('/atlas')
+def atlas():
+    """FRA Atlas - Interactive mapping portal"""
+    return render_template('atlas.html', mapbox_token=load_mapbox_token())
 
 @app.route('/ocr')
 def ocr_portal():
@@ -98,7 +133,7 @@ def get_districts():
     """Get list of districts with FRA data"""
     try:
         districts = data_manager.get_districts()
-        return jsonify({'status': 'success', 'districts': districts})
+        return conditional_json({'status': 'success', 'districts': districts}, data_manager.get_data_etag())
     except Exception as e:
         logger.error(f"Error fetching districts: {str(e)}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
@@ -108,7 +143,8 @@ def get_beneficiaries(district):
     """Get beneficiaries data for a specific district"""
     try:
         beneficiaries = data_manager.get_beneficiaries_by_district(district)
-        return jsonify({'status': 'success', 'data': beneficiaries})
+        return conditional_json({'status': 'success', 'data': beneficiaries},
+                                f"{data_manager.get_data_etag()}-{district}")
     except Exception as e:
         logger.error(f"Error fetching beneficiaries for {district}: {str(e)}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
@@ -172,7 +208,7 @@ def get_statistics():
     """Get overall FRA implementation statistics"""
     try:
         stats = data_manager.get_overall_statistics()
-        return jsonify({'status': 'success', 'stats': stats})
+        return conditional_json({'status': 'success', 'stats': stats}, data_manager.get_data_etag())
     except Exception as e:
         logger.error(f"Error fetching statistics: {str(e)}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
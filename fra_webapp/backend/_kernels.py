@@ -0,0 +1,76 @@
+"""
+Numeric Kernels Module
+Optional numba-compiled kernels for per-point geospatial math
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def jitter_coords(lat0, lng0, offsets):
+        out = np.empty_like(offsets)
+        for i in prange(offsets.shape[0]):
+            out[i, 0] = lat0 + offsets[i, 0]
+            out[i, 1] = lng0 + offsets[i, 1]
+        return out
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def weighted_bucket_scores(scores, weights, thresholds):
+        overall = np.empty(scores.shape[0], dtype=scores.dtype)
+        buckets = np.empty(scores.shape[0], dtype=np.int64)
+        for i in prange(scores.shape[0]):
+            acc = 0.0
+            for j in range(scores.shape[1]):
+                acc += scores[i, j] * weights[j]
+            overall[i] = acc
+            bucket = 0
+            for threshold in thresholds:
+                if acc >= threshold:
+                    bucket += 1
+            buckets[i] = bucket
+        return overall, buckets
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def haversine_matrix(lat_a, lon_a, lat_b, lon_b):
+        out = np.empty((lat_a.shape[0], lat_b.shape[0]))
+        for i in prange(lat_a.shape[0]):
+            for j in range(lat_b.shape[0]):
+                dlat = (lat_b[j] - lat_a[i]) / 2.0
+                dlon = (lon_b[j] - lon_a[i]) / 2.0
+                h = np.sin(dlat) ** 2 + np.cos(lat_a[i]) * np.cos(lat_b[j]) * np.sin(dlon) ** 2
+                out[i, j] = 12742.0 * np.arcsin(np.sqrt(h))
+        return out
+
+    # Warm up with dummy calls so the JIT compile cost is paid at
+    # import time, not on the first user request. The dtypes must match
+    # the production call sites - batch scoring passes float32 scores
+    # and weights - or numba compiles a fresh signature on first use
+    jitter_coords(0.0, 0.0, np.zeros((1, 2)))
+    weighted_bucket_scores(np.zeros((1, 2), dtype=np.float32), np.zeros(2, dtype=np.float32), np.zeros(1))
+    haversine_matrix(np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1))
+else:
+    def jitter_coords(lat0, lng0, offsets):
+        """NumPy fallback when numba is not installed"""
+        return np.array([lat0, lng0]) + offsets
+
+    def weighted_bucket_scores(scores, weights, thresholds):
+        """NumPy fallback when numba is not installed"""
+        overall = scores @ weights
+        return overall, np.digitize(overall, thresholds)
+
+    def haversine_matrix(lat_a, lon_a, lat_b, lon_b):
+        """NumPy fallback when numba is not installed
+
+        All coordinates in radians; returns great-circle km with rows
+        for the first point set and columns for the second.
+        """
+        dlat = (lat_b[None, :] - lat_a[:, None]) / 2.0
+        dlon = (lon_b[None, :] - lon_a[:, None]) / 2.0
+        h = np.sin(dlat) ** 2 + np.cos(lat_a)[:, None] * np.cos(lat_b)[None, :] * np.sin(dlon) ** 2
+        return 12742.0 * np.arcsin(np.sqrt(h))
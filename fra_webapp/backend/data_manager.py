@@ -5,21 +5,125 @@ Handles data loading, processing, and management for FRA beneficiaries
 
 import os
 import json
-import csv
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
+import numpy as np
 from typing import Dict, List, Tuple
 import logging
 from datetime import datetime
 import re
 
+from ._kernels import jitter_coords
+
 logger = logging.getLogger(__name__)
 
+# Compiled once - extract_district_name runs per PDF in load_district_data
+_DISTRICT_STRIP_RE = re.compile(r'(frabenef|beneficiaries|benef|list|_\d+|\s+\(\d+\))')
+
+# Fixed label sets for the repeated-string columns; stored as small
+# integer codes plus one shared index instead of a Python string per cell
+_CATEGORICAL_COLUMNS = {
+    'status': pd.CategoricalDtype(['Approved', 'Pending', 'Under Review', 'Rejected']),
+    'claim_type': pd.CategoricalDtype(['Individual Forest Rights', 'Community Forest Rights', 'Community Forest Resource Rights']),
+    'community_type': pd.CategoricalDtype(['Scheduled Tribes', 'Other Traditional Forest Dwellers']),
+    'forest_type': pd.CategoricalDtype(['Reserved Forest', 'Protected Forest', 'Community Forest'])
+}
+
+# Root entropy for all mock-data random streams
+_MOCK_SEED_ROOT = 42
+
+def _district_seed(district: str) -> np.random.SeedSequence:
+    """Build a deterministic, collision-free seed for a district's RNG stream
+
+    Keyed on the district name bytes rather than hash() so streams are
+    independent, reproducible across processes (hash randomization does
+    not apply) and free of the old 1000-value collision space.
+    """
+    return np.random.SeedSequence([_MOCK_SEED_ROOT, *district.encode('utf-8')])
+
+def _sample_villages(district: str) -> List[str]:
+    """Get sample village names for a district"""
+    base_villages = [
+        'Rampur', 'Krishnapur', 'Gopalpur', 'Madhupur', 'Balaram',
+        'Chandanpur', 'Haridwar', 'Banjari', 'Kumarpur', 'Jaganath',
+        'Raghunath', 'Sankara', 'Dharampur', 'Jadupur', 'Mahendra'
+    ]
+
+    # Add district prefix to make unique
+    return [f"{village} ({district})" for village in base_villages[:10]]
+
+def _random_dates(rng, count: int) -> np.ndarray:
+    """Generate random dates between 2010 and 2024 for mock data"""
+    try:
+        start_date = np.datetime64('2010-01-01')
+        end_date = np.datetime64('2024-12-31')
+
+        # One batched draw over datetime64 days, formatted in a single
+        # strftime pass instead of per-row timedelta construction
+        total_days = int((end_date - start_date).astype(int)) + 1
+        days = rng.integers(0, total_days, count)
+        dates = start_date + days.astype('timedelta64[D]')
+
+        return pd.to_datetime(dates).strftime('%d/%m/%Y').to_numpy()
+
+    except Exception as e:
+        logger.error(f"Error generating random dates: {str(e)}")
+        return np.full(count, '01/01/2020')
+
+def _generate_district_frame(district: str, seed) -> pd.DataFrame:
+    """Generate one district's mock beneficiary frame
+
+    Top-level (not a method) so ProcessPoolExecutor can pickle it and
+    fan districts out across worker processes.
+    """
+    try:
+        rng = np.random.default_rng(seed)
+
+        num_beneficiaries = int(rng.integers(100, 1001))
+        serials = np.arange(1, num_beneficiaries + 1)
+
+        villages = _sample_villages(district)
+        claim_types = ['Individual Forest Rights', 'Community Forest Rights', 'Community Forest Resource Rights']
+
+        # Draw every field as one batch instead of one RNG call per row
+        return pd.DataFrame({
+            'id': [f"{district}_{i:04d}" for i in serials],
+            'name': [f"Beneficiary {i}" for i in serials],
+            'father_name': [f"Father {i}" for i in serials],
+            'village': rng.choice(villages, num_beneficiaries),
+            'district': district,
+            'claim_type': rng.choice(claim_types, num_beneficiaries),
+            'area_acres': np.round(rng.uniform(0.5, 5.0, num_beneficiaries), 2),
+            'survey_number': np.char.add(
+                np.char.add(rng.integers(100, 1000, num_beneficiaries).astype(str), '/'),
+                rng.integers(1, 51, num_beneficiaries).astype(str)
+            ),
+            'status': rng.choice(['Approved', 'Pending', 'Under Review', 'Rejected'], num_beneficiaries),
+            'approval_date': _random_dates(rng, num_beneficiaries),
+            'community_type': rng.choice(['Scheduled Tribes', 'Other Traditional Forest Dwellers'], num_beneficiaries),
+            'forest_type': rng.choice(['Reserved Forest', 'Protected Forest', 'Community Forest'], num_beneficiaries)
+        })
+
+    except Exception as e:
+        logger.error(f"Error generating mock data for {district}: {str(e)}")
+        return pd.DataFrame()
+
 class DataManager:
     def __init__(self):
         """Initialize Data Manager"""
         self.data_dir = '../dataset_odisha'
         self.processed_data = {}
-        self.districts_data = {}
+        # Canonical beneficiary store: one columnar DataFrame plus a
+        # district -> row-indices map; list-of-dict records are only
+        # materialized at the API boundary
+        self._df = pd.DataFrame()
+        self._district_index = {}
+        self._search_blob = pd.Series(dtype='object')
+        self._stats_cache = None
+        self._summary_df = pd.DataFrame()
+        self._data_etag = '0'
+        self._last_updated_iso = datetime.now().isoformat()
         
         # District name mapping for consistency
         self.district_mapping = {
@@ -76,15 +180,29 @@ class DataManager:
             
             pdf_files = [f for f in os.listdir(self.data_dir) if f.endswith('.pdf')]
             logger.info(f"Found {len(pdf_files)} PDF files to process")
-            
-            for pdf_file in pdf_files:
-                district_name = self.extract_district_name(pdf_file)
-                if district_name:
-                    # For now, create mock data since we can't process PDFs directly
-                    # In production, you would use OCR to extract actual data
-                    self.districts_data[district_name] = self.generate_mock_beneficiary_data(district_name)
-                    logger.info(f"Loaded data for district: {district_name}")
-        
+
+            # For now, create mock data since we can't process PDFs directly
+            # In production, you would use OCR to extract actual data
+            districts = [self.extract_district_name(f) for f in pdf_files]
+            # Two PDFs can map to the same canonical district (e.g. the
+            # kenpara/kendrapara aliases) - keep one copy, as the old
+            # per-district dict assignment did
+            districts = list(dict.fromkeys(d for d in districts if d))
+            seeds = [_district_seed(d) for d in districts]
+
+            # Districts are independent, so generation (and, in
+            # production, per-PDF OCR) fans out across worker processes
+            with ProcessPoolExecutor() as executor:
+                district_frames = list(executor.map(_generate_district_frame, districts, seeds))
+
+            for district_name in districts:
+                logger.info(f"Loaded data for district: {district_name}")
+
+            self._df = pd.concat(district_frames, ignore_index=True) if district_frames else pd.DataFrame()
+            if not self._df.empty:
+                self._df = self._df.astype(_CATEGORICAL_COLUMNS)
+            self._district_index = self._df.groupby('district', sort=False).indices if not self._df.empty else {}
+
         except Exception as e:
             logger.error(f"Error loading district data: {str(e)}")
             raise
@@ -93,8 +211,8 @@ class DataManager:
         """Extract district name from filename"""
         try:
             # Remove file extension and common suffixes
-            name = filename.lower().replace('.pdf', '')
-            name = re.sub(r'(frabenef|beneficiaries|benef|list|_\d+|\s+\(\d+\))', '', name)
+            name = filename.lower().removesuffix('.pdf')
+            name = _DISTRICT_STRIP_RE.sub('', name)
             name = name.strip('_').strip()
             
             # Map to standard district name
@@ -104,70 +222,9 @@ class DataManager:
             logger.error(f"Error extracting district name from {filename}: {str(e)}")
             return None
     
-    def generate_mock_beneficiary_data(self, district: str) -> List[Dict]:
+    def generate_mock_beneficiary_data(self, district: str) -> pd.DataFrame:
         """Generate mock beneficiary data for demonstration"""
-        try:
-            import random
-            random.seed(hash(district) % 1000)  # Consistent data for same district
-            
-            beneficiaries = []
-            num_beneficiaries = random.randint(100, 1000)
-            
-            villages = self.get_sample_villages(district)
-            claim_types = ['Individual Forest Rights', 'Community Forest Rights', 'Community Forest Resource Rights']
-            
-            for i in range(num_beneficiaries):
-                beneficiary = {
-                    'id': f"{district}_{i+1:04d}",
-                    'name': f"Beneficiary {i+1}",
-                    'father_name': f"Father {i+1}",
-                    'village': random.choice(villages),
-                    'district': district,
-                    'claim_type': random.choice(claim_types),
-                    'area_acres': round(random.uniform(0.5, 5.0), 2),
-                    'survey_number': f"{random.randint(100, 999)}/{random.randint(1, 50)}",
-                    'status': random.choice(['Approved', 'Pending', 'Under Review', 'Rejected']),
-                    'approval_date': self.generate_random_date(),
-                    'community_type': random.choice(['Scheduled Tribes', 'Other Traditional Forest Dwellers']),
-                    'forest_type': random.choice(['Reserved Forest', 'Protected Forest', 'Community Forest'])
-                }
-                beneficiaries.append(beneficiary)
-            
-            return beneficiaries
-            
-        except Exception as e:
-            logger.error(f"Error generating mock data for {district}: {str(e)}")
-            return []
-    
-    def get_sample_villages(self, district: str) -> List[str]:
-        """Get sample village names for a district"""
-        base_villages = [
-            'Rampur', 'Krishnapur', 'Gopalpur', 'Madhupur', 'Balaram',
-            'Chandanpur', 'Haridwar', 'Banjari', 'Kumarpur', 'Jaganath',
-            'Raghunath', 'Sankara', 'Dharampur', 'Jadupur', 'Mahendra'
-        ]
-        
-        # Add district prefix to make unique
-        return [f"{village} ({district})" for village in base_villages[:10]]
-    
-    def generate_random_date(self) -> str:
-        """Generate random date for mock data"""
-        try:
-            import random
-            from datetime import datetime, timedelta
-            
-            # Random date between 2010 and 2024
-            start_date = datetime(2010, 1, 1)
-            end_date = datetime(2024, 12, 31)
-            
-            random_date = start_date + timedelta(
-                days=random.randint(0, (end_date - start_date).days)
-            )
-            
-            return random_date.strftime('%d/%m/%Y')
-            
-        except:
-            return '01/01/2020'
+        return _generate_district_frame(district, _district_seed(district))  # Consistent data for same district
     
     def process_beneficiary_data(self):
         """Process and structure beneficiary data"""
@@ -179,51 +236,126 @@ class DataManager:
                 'by_claim_type': {},
                 'by_community_type': {}
             }
-            
-            for district, beneficiaries in self.districts_data.items():
-                self.processed_data['total_beneficiaries'] += len(beneficiaries)
-                
+
+            if not self._df.empty:
+                # The columnar store makes these aggregations vectorized
+                # C loops instead of per-record Python iteration
+                grouped = self._df.groupby('district', sort=False)
+                areas = grouped['area_acres'].sum()
+
+                # One (district, status) scan feeds the per-district
+                # approved/pending counts, the per-district totals and
+                # the global status breakdown
+                status_table = self._df.groupby(['district', 'status'], observed=True).size().unstack(fill_value=0)
+                status_table = status_table.reindex(
+                    columns=status_table.columns.union(['Approved', 'Pending']), fill_value=0
+                )
+                totals = status_table.sum(axis=1)
+
                 # District-wise statistics
-                self.processed_data['districts'][district] = {
-                    'total': len(beneficiaries),
-                    'approved': len([b for b in beneficiaries if b['status'] == 'Approved']),
-                    'pending': len([b for b in beneficiaries if b['status'] == 'Pending']),
-                    'total_area': sum([b['area_acres'] for b in beneficiaries]),
-                    'beneficiaries': beneficiaries
-                }
-                
+                for district, district_df in grouped:
+                    total = int(totals.get(district, 0))
+                    approved = int(status_table.at[district, 'Approved'])
+                    pending = int(status_table.at[district, 'Pending'])
+
+                    self.processed_data['districts'][district] = {
+                        'total': total,
+                        'approved': approved,
+                        'pending': pending,
+                        'total_area': float(areas.get(district, 0.0)),
+                        'summary_cache': self.build_district_summary_cache(
+                            district_df, total, approved
+                        )
+                    }
+
+                # District table kept as a DataFrame so
+                # get_overall_statistics serializes it with one to_dict
+                self._summary_df = pd.DataFrame({
+                    'total': totals,
+                    'approved': status_table['Approved'],
+                    'pending': status_table['Pending'],
+                    'total_area': areas
+                })
+
                 # Overall statistics
-                for beneficiary in beneficiaries:
-                    # By status
-                    status = beneficiary['status']
-                    self.processed_data['by_status'][status] = self.processed_data['by_status'].get(status, 0) + 1
-                    
-                    # By claim type
-                    claim_type = beneficiary['claim_type']
-                    self.processed_data['by_claim_type'][claim_type] = self.processed_data['by_claim_type'].get(claim_type, 0) + 1
-                    
-                    # By community type
-                    community_type = beneficiary['community_type']
-                    self.processed_data['by_community_type'][community_type] = self.processed_data['by_community_type'].get(community_type, 0) + 1
-            
-            logger.info(f"Processed data for {len(self.districts_data)} districts with {self.processed_data['total_beneficiaries']} total beneficiaries")
-            
+                self.processed_data['total_beneficiaries'] = int(totals.sum())
+                self.processed_data['by_status'] = {k: int(v) for k, v in status_table.sum(axis=0).items() if v}
+                self.processed_data['by_claim_type'] = {k: int(v) for k, v in self._df['claim_type'].value_counts().items() if v}
+                self.processed_data['by_community_type'] = {k: int(v) for k, v in self._df['community_type'].value_counts().items() if v}
+
+                # Lowercased search index over the searchable columns so
+                # search_beneficiaries runs one vectorized str.contains;
+                # fields are joined on a control character no query can
+                # contain, so matches never span field boundaries
+                self._search_blob = (
+                    self._df['name'] + '\x1f' + self._df['village'] + '\x1f' + self._df['survey_number']
+                ).str.lower()
+
+                # Content hash of the store, used as the ETag for
+                # conditional GETs on the read-only endpoints
+                self._data_etag = f"{int(pd.util.hash_pandas_object(self._df).sum()) & 0xffffffffffffffff:x}"
+
+            # Aggregates changed, so the statistics cache must be rebuilt
+            self._stats_cache = None
+            self._last_updated_iso = datetime.now().isoformat()
+
+            logger.info(f"Processed data for {len(self._district_index)} districts with {self.processed_data['total_beneficiaries']} total beneficiaries")
+
         except Exception as e:
             logger.error(f"Error processing beneficiary data: {str(e)}")
             raise
+
+    def build_district_summary_cache(self, district_df, total: int, approved: int) -> Dict:
+        """Build cached summary aggregates for a district
+
+        Computed once during process_beneficiary_data so get_district_summary
+        can serve repeated requests without rescanning beneficiaries.
+        """
+        try:
+            if district_df is None or district_df.empty:
+                return {
+                    'villages': [],
+                    'total_villages': 0,
+                    'claim_type_breakdown': {},
+                    'community_type_breakdown': {},
+                    'status_breakdown': {},
+                    'approval_rate': 0
+                }
+
+            villages = district_df['village'].unique().tolist()
+
+            return {
+                'villages': villages,
+                'total_villages': len(villages),
+                'claim_type_breakdown': {k: int(v) for k, v in district_df['claim_type'].value_counts().items() if v},
+                'community_type_breakdown': {k: int(v) for k, v in district_df['community_type'].value_counts().items() if v},
+                'status_breakdown': {k: int(v) for k, v in district_df['status'].value_counts().items() if v},
+                'approval_rate': (approved / total) * 100 if total > 0 else 0
+            }
+
+        except Exception as e:
+            logger.error(f"Error building summary cache: {str(e)}")
+            return {}
     
+    def get_data_etag(self) -> str:
+        """Get the ETag identifying the current beneficiary data version"""
+        return self._data_etag
+
     def get_districts(self) -> List[str]:
         """Get list of available districts"""
         try:
-            return list(self.districts_data.keys())
+            return list(self._district_index.keys())
         except Exception as e:
             logger.error(f"Error getting districts: {str(e)}")
             return []
-    
+
     def get_beneficiaries_by_district(self, district: str) -> List[Dict]:
         """Get beneficiaries for a specific district"""
         try:
-            return self.districts_data.get(district, [])
+            indices = self._district_index.get(district)
+            if indices is None:
+                return []
+            return self._df.iloc[indices].to_dict('records')
         except Exception as e:
             logger.error(f"Error getting beneficiaries for {district}: {str(e)}")
             return []
@@ -233,29 +365,25 @@ class DataManager:
         try:
             if not self.processed_data:
                 self.process_beneficiary_data()
-            
-            stats = {
-                'total_beneficiaries': self.processed_data['total_beneficiaries'],
-                'total_districts': len(self.districts_data),
-                'total_area_covered': sum([
-                    district_data['total_area'] 
-                    for district_data in self.processed_data['districts'].values()
-                ]),
-                'status_breakdown': self.processed_data['by_status'],
-                'claim_type_breakdown': self.processed_data['by_claim_type'],
-                'community_type_breakdown': self.processed_data['by_community_type'],
-                'district_wise_summary': {
-                    district: {
-                        'total': data['total'],
-                        'approved': data['approved'],
-                        'pending': data['pending'],
-                        'total_area': data['total_area']
-                    }
-                    for district, data in self.processed_data['districts'].items()
-                },
-                'last_updated': datetime.now().isoformat()
-            }
-            
+
+            if self._stats_cache is None:
+                # One vectorized pass per column; reused until the store
+                # is reprocessed
+                self._stats_cache = {
+                    'total_beneficiaries': self.processed_data['total_beneficiaries'],
+                    'total_districts': len(self._district_index),
+                    'total_area_covered': float(self._df['area_acres'].sum()) if not self._df.empty else 0.0,
+                    'status_breakdown': self.processed_data['by_status'],
+                    'claim_type_breakdown': self.processed_data['by_claim_type'],
+                    'community_type_breakdown': self.processed_data['by_community_type'],
+                    'district_wise_summary': self._summary_df.to_dict('index') if not self._summary_df.empty else {}
+                }
+
+            stats = dict(self._stats_cache)
+            # Report when the data was last aggregated, not "now" -
+            # keeps repeated responses byte-identical for the ETag path
+            stats['last_updated'] = self._last_updated_iso
+
             return stats
             
         except Exception as e:
@@ -265,20 +393,14 @@ class DataManager:
     def search_beneficiaries(self, query: str, district: str = None) -> List[Dict]:
         """Search beneficiaries by name or other criteria"""
         try:
-            results = []
-            query_lower = query.lower()
-            
-            districts_to_search = [district] if district else self.districts_data.keys()
-            
-            for dist in districts_to_search:
-                beneficiaries = self.districts_data.get(dist, [])
-                for beneficiary in beneficiaries:
-                    if (query_lower in beneficiary['name'].lower() or
-                        query_lower in beneficiary['village'].lower() or
-                        query_lower in beneficiary['survey_number'].lower()):
-                        results.append(beneficiary)
-            
-            return results
+            if self._df.empty:
+                return []
+
+            mask = self._search_blob.str.contains(query.lower(), regex=False, na=False)
+            if district:
+                mask &= self._df['district'] == district
+
+            return self._df[mask].to_dict('records')
             
         except Exception as e:
             logger.error(f"Error searching beneficiaries: {str(e)}")
@@ -287,9 +409,9 @@ class DataManager:
     def export_to_csv(self, district: str) -> str:
         """Export district data to CSV"""
         try:
-            beneficiaries = self.get_beneficiaries_by_district(district)
-            
-            if not beneficiaries:
+            indices = self._district_index.get(district)
+
+            if indices is None or len(indices) == 0:
                 raise ValueError(f"No data found for district: {district}")
             
             # Create CSV file
@@ -297,15 +419,11 @@ class DataManager:
             filepath = os.path.join('data', filename)
             
             os.makedirs('data', exist_ok=True)
+
+            # pandas writes the whole district slice in one C loop
+            self._df.iloc[indices].to_csv(filepath, index=False, encoding='utf-8')
             
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                if beneficiaries:
-                    fieldnames = beneficiaries[0].keys()
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(beneficiaries)
-            
-            logger.info(f"Exported {len(beneficiaries)} records to {filepath}")
+            logger.info(f"Exported {len(indices)} records to {filepath}")
             return filepath
             
         except Exception as e:
@@ -315,35 +433,52 @@ class DataManager:
     def export_to_geojson(self, district: str) -> str:
         """Export district data to GeoJSON format"""
         try:
-            from .gis_processor import GISProcessor
-            
-            beneficiaries = self.get_beneficiaries_by_district(district)
-            gis_processor = GISProcessor()
-            
+            from .gis_processor import get_gis_processor
+
+            indices = self._district_index.get(district)
+            gis_processor = get_gis_processor()
+
             # Add coordinates to beneficiaries (mock coordinates for demo)
             district_info = gis_processor.get_district_info(district)
-            
-            if district_info and beneficiaries:
+
+            features = []
+            if district_info is not None and indices is not None and len(indices) > 0:
+                district_df = self._df.iloc[indices]
                 center_coords = district_info['coordinates']
-                
-                # Add random coordinates around district center
-                import random
-                random.seed(hash(district) % 1000)
-                
-                for i, beneficiary in enumerate(beneficiaries):
-                    # Random offset within district
-                    lat_offset = random.uniform(-0.2, 0.2)
-                    lng_offset = random.uniform(-0.2, 0.2)
-                    
-                    beneficiary['coordinates'] = {
-                        'lat': center_coords['lat'] + lat_offset,
-                        'lng': center_coords['lng'] + lng_offset
+
+                # One batched draw for all offsets, converted to Python
+                # floats in bulk, instead of per-record dict mutation
+                rng = np.random.default_rng(_district_seed(district))
+                offsets = rng.uniform(-0.2, 0.2, (len(district_df), 2))
+                coords = jitter_coords(center_coords['lat'], center_coords['lng'], offsets)
+                lats = coords[:, 0].tolist()
+                lngs = coords[:, 1].tolist()
+
+                features = [
+                    {
+                        'type': 'Feature',
+                        'properties': properties,
+                        'geometry': {
+                            'type': 'Point',
+                            'coordinates': [lng, lat]
+                        }
                     }
-            
+                    for properties, lat, lng in zip(district_df.to_dict('records'), lats, lngs)
+                ]
+
+            geojson = {
+                'type': 'FeatureCollection',
+                'features': features
+            }
+
             # Export as GeoJSON
             filename = f"{district}_beneficiaries_{datetime.now().strftime('%Y%m%d')}.geojson"
-            filepath = gis_processor.export_to_geojson(beneficiaries, filename.replace('.geojson', ''))
-            
+            filepath = os.path.join('data', filename)
+            os.makedirs('data', exist_ok=True)
+
+            with open(filepath, 'w') as f:
+                json.dump(geojson, f, indent=2)
+
             return filepath
             
         except Exception as e:
@@ -355,44 +490,27 @@ class DataManager:
         try:
             if district not in self.processed_data['districts']:
                 return {}
-            
+
             district_data = self.processed_data['districts'][district]
-            beneficiaries = district_data['beneficiaries']
-            
-            # Calculate additional statistics
-            villages = set([b['village'] for b in beneficiaries])
-            claim_types = {}
-            community_types = {}
-            status_counts = {}
-            
-            for beneficiary in beneficiaries:
-                # Claim types
-                claim_type = beneficiary['claim_type']
-                claim_types[claim_type] = claim_types.get(claim_type, 0) + 1
-                
-                # Community types
-                community_type = beneficiary['community_type']
-                community_types[community_type] = community_types.get(community_type, 0) + 1
-                
-                # Status
-                status = beneficiary['status']
-                status_counts[status] = status_counts.get(status, 0) + 1
-            
+            cache = district_data.get('summary_cache', {})
+
+            # Aggregates were precomputed in process_beneficiary_data,
+            # so this is a dict lookup instead of a per-request rescan
             summary = {
                 'district': district,
                 'total_beneficiaries': district_data['total'],
-                'total_villages': len(villages),
+                'total_villages': cache.get('total_villages', 0),
                 'total_area_acres': district_data['total_area'],
                 'approved_count': district_data['approved'],
                 'pending_count': district_data['pending'],
-                'approval_rate': (district_data['approved'] / district_data['total']) * 100 if district_data['total'] > 0 else 0,
-                'claim_type_breakdown': claim_types,
-                'community_type_breakdown': community_types,
-                'status_breakdown': status_counts,
-                'villages': list(villages),
-                'last_updated': datetime.now().isoformat()
+                'approval_rate': cache.get('approval_rate', 0),
+                'claim_type_breakdown': cache.get('claim_type_breakdown', {}),
+                'community_type_breakdown': cache.get('community_type_breakdown', {}),
+                'status_breakdown': cache.get('status_breakdown', {}),
+                'villages': cache.get('villages', []),
+                'last_updated': self._last_updated_iso
             }
-            
+
             return summary
             
         except Exception as e:
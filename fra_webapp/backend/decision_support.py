@@ -3,56 +3,248 @@ Decision Support System Module
 Provides AI-powered eligibility assessment for FRA implementation
 """
 
+import bisect
+import functools
 import json
-import pandas as pd
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 from typing import Dict, List, Tuple
 import logging
 from datetime import datetime, timedelta
 
+from ._kernels import weighted_bucket_scores
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Shared immutable configuration, built once at import instead of per
+# DecisionSupportSystem instance
+
+# FRA eligibility criteria
+_CRITERIA = {
+    'residence_period': 75,  # years before 2005
+    'forest_dwelling': True,
+    'forest_dependence': True,
+    'community_types': (
+        'Scheduled Tribes',
+        'Other Traditional Forest Dwellers',
+        'Primitive Tribal Groups'
+    ),
+    'land_types': (
+        'Forest Land',
+        'Assigned Land',
+        'Government Land in Forest Areas'
+    ),
+    'rights_types': (
+        'Individual Forest Rights',
+        'Community Forest Rights',
+        'Community Forest Resource Rights'
+    )
+}
+
+# Eligibility weights for scoring
+_WEIGHTS = {
+    'community_type': 0.25,
+    'residence_period': 0.20,
+    'forest_dependence': 0.20,
+    'documentation': 0.15,
+    'land_use': 0.10,
+    'community_support': 0.10
+}
+_WEIGHT_ITEMS = tuple(_WEIGHTS.items())
+
+# Community labels worth interning for pointer-fast comparison
+_KNOWN_COMMUNITY_TYPES = frozenset({
+    'Scheduled Tribes', 'ST',
+    'Other Traditional Forest Dwellers', 'OTFD',
+    'Primitive Tribal Groups', 'PTG'
+})
+
+# Score buckets as sorted threshold tuples with parallel label/score
+# tuples, looked up by bisect instead of if/elif ladders
+_STATUS_THRESHOLDS = (40.0, 60.0, 80.0)
+_STATUS_LABELS = ('Not Eligible', 'Conditionally Eligible', 'Eligible', 'Highly Eligible')
+_RESIDENCE_THRESHOLDS = (1930, 1980, 2005)
+_RESIDENCE_SCORES = (100.0, 80.0, 60.0, 10.0)
+
+# Forest-based occupations, compiled once into a single alternation so
+# dependence checks are one C-level scan instead of one substring
+# search per phrase
+_FOREST_OCCUPATIONS = (
+    'forest produce collection', 'agriculture in forest', 'cattle grazing',
+    'honey collection', 'medicinal plants', 'bamboo collection',
+    'tendu leaf collection', 'sal leaf collection'
+)
+_FOREST_OCC_RE = re.compile('|'.join(map(re.escape, _FOREST_OCCUPATIONS)))
+
+# First word of each occupation phrase; a text containing any full
+# phrase necessarily contains one of these, so the common no-match
+# case is rejected on cheap short-token scans before the alternation
+_FOREST_FIRST_TOKENS = frozenset(phrase.split(' ', 1)[0] for phrase in _FOREST_OCCUPATIONS)
+
+# Columns the batch scorer reads, and the sentinel marking a key that
+# is absent from an application dict - an explicit None/NaN value must
+# take the scalar guard defaults, not the missing-key defaults
+_BATCH_COLUMNS = (
+    'community_type', 'residence_since', 'primary_occupation',
+    'secondary_occupation', 'forest_activities', 'documents',
+    'land_use', 'land_type', 'gram_sabha_resolution',
+    'community_support_letters'
+)
+_MISSING = object()
+
+def _parse_year(value):
+    """Replicate assess_residence_period's year parsing for one value
+
+    Strings take int() of the last '/'-segment, then of the leading
+    four characters; other values truncate through int(). NaN marks the
+    rows that keep the 30.0 data-unavailable default - int() is used
+    directly so the batch path accepts and rejects exactly the same
+    literals as the scalar path (to_numeric would admit floats,
+    exponents and infinities that int() raises on).
+    """
+    try:
+        if isinstance(value, str):
+            try:
+                return float(int(value.rsplit('/', 1)[-1]))
+            except ValueError:
+                return float(int(value[:4]))
+        return float(int(value))
+    except (TypeError, ValueError):
+        return np.nan
+
+def _matches_forest_occupation(text: str) -> bool:
+    """Check a lowercased occupation string for a forest-based phrase"""
+    if not any(token in text for token in _FOREST_FIRST_TOKENS):
+        return False
+    return _FOREST_OCC_RE.search(text) is not None
+
+# Per-criterion recommendation rules (criterion, score threshold,
+# message) and the shared closing recommendations
+_RECOMMENDATION_RULES = (
+    ('community_type', 80, 'Verify community type with proper tribal/OTFD certificate'),
+    ('residence_period', 60, 'Collect additional evidence of residence before 2005'),
+    ('forest_dependence', 60, 'Document forest-based livelihood activities with evidence'),
+    ('documentation', 70, 'Complete documentation with all required certificates'),
+    ('community_support', 70, 'Obtain Gram Sabha resolution and community support letters')
+)
+_RECOMMENDATIONS_GOOD = (
+    'Application has good potential for approval',
+    'Submit to Forest Rights Committee for review'
+)
+_RECOMMENDATIONS_WEAK = (
+    'Strengthen application before submission',
+    'Seek assistance from NGOs or community leaders'
+)
+
+# Next-step bundles indexed by the eligibility bucket
+_NEXT_STEPS = (
+    (
+        "1. Review FRA eligibility criteria carefully",
+        "2. Seek legal aid or NGO assistance",
+        "3. Consider alternative land rights schemes if eligible",
+        "4. Build stronger case with community support"
+    ),
+    (
+        "1. Address major gaps identified in assessment",
+        "2. Seek assistance from local NGOs or community workers",
+        "3. Collect missing critical documents",
+        "4. Re-submit when application is strengthened"
+    ),
+    (
+        "1. Review and strengthen weak areas in application",
+        "2. Collect additional supporting documents",
+        "3. Submit to SDLC with complete documentation",
+        "4. Be prepared for field verification"
+    ),
+    (
+        "1. Submit application to Sub-Divisional Level Committee (SDLC)",
+        "2. Attend field verification if requested",
+        "3. Present case to District Level Committee (DLC)",
+        "4. Await final approval and title deed issuance"
+    )
+)
+
+# Required documents as ordered (key, human-readable name) pairs;
+# iteration order is the report order and positions define the bits
+_REQUIRED_DOCS = (
+    ('residence_proof', 'Residence proof (ration card, voter ID, etc.)'),
+    ('community_certificate', 'Scheduled Tribe/OTFD certificate'),
+    ('land_records', 'Land records and survey settlement'),
+    ('forest_dependence_proof', 'Forest dependence evidence'),
+    ('community_resolution', 'Gram Sabha resolution'),
+    ('identity_proof', 'Identity proof documents'),
+    ('photographs', 'Recent photographs'),
+    ('land_sketch', 'Land sketch/map')
+)
+
+@functools.lru_cache(maxsize=1)
+def get_decision_support_system() -> 'DecisionSupportSystem':
+    """Get the shared DecisionSupportSystem instance
+
+    The system carries no per-request state, so one instance (with its
+    compiled regex and sniffed-parser caches) serves the whole process.
+    """
+    return DecisionSupportSystem()
+
+def _assess_application_chunk(applications: List[Dict]) -> List[Dict]:
+    """Score one chunk of applications in a worker process"""
+    return get_decision_support_system().batch_assessment(applications)
+
+# Bit per required document, in _REQUIRED_DOCS order
+_DOC_BITS = {key: 1 << i for i, (key, _) in enumerate(_REQUIRED_DOCS)}
+
+def _document_mask(documents) -> int:
+    """Encode submitted documents as a requirement-presence bitmask
+
+    Keeps the substring containment semantics of the original check: a
+    document satisfies a requirement when either name contains the
+    other.
+    """
+    if not isinstance(documents, list):
+        return 0
+    
+    mask = 0
+    for document in documents:
+        document = document.lower()
+        for key, bit in _DOC_BITS.items():
+            if key in document or document in key:
+                mask |= bit
+    
+    return mask
+
 class DecisionSupportSystem:
     def __init__(self):
         """Initialize Decision Support System"""
-        # FRA eligibility criteria
-        self.criteria = {
-            'residence_period': 75,  # years before 2005
-            'forest_dwelling': True,
-            'forest_dependence': True,
-            'community_types': [
-                'Scheduled Tribes',
-                'Other Traditional Forest Dwellers',
-                'Primitive Tribal Groups'
-            ],
-            'land_types': [
-                'Forest Land',
-                'Assigned Land',
-                'Government Land in Forest Areas'
-            ],
-            'rights_types': [
-                'Individual Forest Rights',
-                'Community Forest Rights',
-                'Community Forest Resource Rights'
-            ]
-        }
-        
-        # Eligibility weights for scoring
-        self.weights = {
-            'community_type': 0.25,
-            'residence_period': 0.20,
-            'forest_dependence': 0.20,
-            'documentation': 0.15,
-            'land_use': 0.10,
-            'community_support': 0.10
-        }
+        self.criteria = _CRITERIA
+        self.weights = _WEIGHTS
+        self._weight_items = _WEIGHT_ITEMS
+        self.forest_occupations = _FOREST_OCCUPATIONS
+        self._forest_occ_re = _FOREST_OCC_RE
+
+        # Specialized residence-year parser, assigned after the first
+        # successfully sniffed date format
+        self._year_parser = None
     
-    def assess_eligibility(self, application_data: Dict) -> Dict:
-        """Assess FRA eligibility for an application"""
+    def assess_eligibility(self, application_data: Dict, assessment_date: str = None) -> Dict:
+        """Assess FRA eligibility for an application
+
+        assessment_date lets batch callers stamp a whole batch with one
+        timestamp instead of a datetime.now() call per application.
+        """
         try:
             assessment = {
                 'application_id': application_data.get('id', 'N/A'),
                 'applicant_name': application_data.get('name', 'N/A'),
-                'assessment_date': datetime.now().isoformat(),
+                'assessment_date': assessment_date or datetime.now().isoformat(),
                 'scores': {},
                 'overall_score': 0,
                 'eligibility_status': 'Not Eligible',
@@ -61,30 +253,44 @@ class DecisionSupportSystem:
                 'next_steps': []
             }
             
+            # Normalize the string fields once so the per-criterion
+            # methods read pre-stripped/lowered values
+            normalized_data = self.normalize_application(application_data)
+
             # Assess each criterion
-            assessment['scores']['community_type'] = self.assess_community_type(application_data)
-            assessment['scores']['residence_period'] = self.assess_residence_period(application_data)
-            assessment['scores']['forest_dependence'] = self.assess_forest_dependence(application_data)
-            assessment['scores']['documentation'] = self.assess_documentation(application_data)
-            assessment['scores']['land_use'] = self.assess_land_use(application_data)
-            assessment['scores']['community_support'] = self.assess_community_support(application_data)
+            assessment['scores']['community_type'] = self.assess_community_type(normalized_data)
+
+            # Perfect scores everywhere else cannot lift the overall
+            # result past this bound; when even that stays under the
+            # lowest eligibility threshold, skip the remaining criteria
+            community_weight = self.weights['community_type']
+            max_possible = assessment['scores']['community_type'] * community_weight + 100.0 * (1 - community_weight)
+            if max_possible < _STATUS_THRESHOLDS[0]:
+                assessment['overall_score'] = round(assessment['scores']['community_type'] * community_weight, 2)
+                assessment['eligibility_status'] = _STATUS_LABELS[0]
+                assessment['fast_path'] = True
+                assessment['recommendations'] = self.generate_recommendations(assessment)
+                assessment['missing_documents'] = self.identify_missing_documents(application_data)
+                assessment['next_steps'] = self.suggest_next_steps(assessment)
+                return assessment
+
+            assessment['scores']['residence_period'] = self.assess_residence_period(normalized_data)
+            assessment['scores']['forest_dependence'] = self.assess_forest_dependence(normalized_data)
+            assessment['scores']['documentation'] = self.assess_documentation(normalized_data)
+            assessment['scores']['land_use'] = self.assess_land_use(normalized_data)
+            assessment['scores']['community_support'] = self.assess_community_support(normalized_data)
             
             # Calculate overall score
             overall_score = 0
-            for criterion, score in assessment['scores'].items():
-                overall_score += score * self.weights[criterion]
+            for criterion, weight in self._weight_items:
+                overall_score += assessment['scores'][criterion] * weight
             
             assessment['overall_score'] = round(overall_score, 2)
             
             # Determine eligibility status
-            if overall_score >= 80:
-                assessment['eligibility_status'] = 'Highly Eligible'
-            elif overall_score >= 60:
-                assessment['eligibility_status'] = 'Eligible'
-            elif overall_score >= 40:
-                assessment['eligibility_status'] = 'Conditionally Eligible'
-            else:
-                assessment['eligibility_status'] = 'Not Eligible'
+            assessment['eligibility_status'] = _STATUS_LABELS[
+                bisect.bisect_right(_STATUS_THRESHOLDS, overall_score)
+            ]
             
             # Generate recommendations
             assessment['recommendations'] = self.generate_recommendations(assessment)
@@ -97,152 +303,177 @@ class DecisionSupportSystem:
             logger.error(f"Error assessing eligibility: {str(e)}")
             return {'error': str(e)}
     
+    @staticmethod
+    def normalize_application(data: Dict) -> Dict:
+        """Normalize string fields of an application once
+
+        The assess_* methods stay tolerant of raw input (their own
+        strip/lower calls become no-ops), but routing through this
+        helper means each string is normalized a single time per
+        record. The community type is interned so the small fixed set
+        of values compares by pointer.
+        """
+        normalized = dict(data)
+
+        community_type = data.get('community_type', '')
+        if isinstance(community_type, str):
+            community_type = community_type.strip()
+            # Intern only the known labels - interning arbitrary user
+            # input would pin it in the intern table forever
+            if community_type in _KNOWN_COMMUNITY_TYPES:
+                community_type = sys.intern(community_type)
+            normalized['community_type'] = community_type
+
+        for field in ('primary_occupation', 'secondary_occupation', 'land_use', 'land_type'):
+            value = data.get(field, '')
+            if isinstance(value, str):
+                normalized[field] = value.lower()
+
+        return normalized
+
     def assess_community_type(self, data: Dict) -> float:
         """Assess community type eligibility"""
-        try:
-            community_type = data.get('community_type', '').strip()
-            
-            if community_type in ['Scheduled Tribes', 'ST']:
-                return 100.0
-            elif community_type in ['Other Traditional Forest Dwellers', 'OTFD']:
-                return 90.0
-            elif community_type in ['Primitive Tribal Groups', 'PTG']:
-                return 100.0
-            elif 'tribal' in community_type.lower():
-                return 85.0
-            else:
-                return 20.0
-                
-        except:
+        community_type = data.get('community_type', '')
+        
+        if not isinstance(community_type, str):
             return 0.0
+        
+        community_type = community_type.strip()
+        
+        if community_type in ['Scheduled Tribes', 'ST']:
+            return 100.0
+        elif community_type in ['Other Traditional Forest Dwellers', 'OTFD']:
+            return 90.0
+        elif community_type in ['Primitive Tribal Groups', 'PTG']:
+            return 100.0
+        elif 'tribal' in community_type.lower():
+            return 85.0
+        else:
+            return 20.0
     
     def assess_residence_period(self, data: Dict) -> float:
         """Assess residence period eligibility"""
+        residence_since = data.get('residence_since', '')
+        
         try:
-            residence_since = data.get('residence_since', '')
-            
             if isinstance(residence_since, str):
-                try:
-                    residence_year = int(residence_since.split('/')[-1])
-                except:
-                    residence_year = int(residence_since[:4])
+                residence_year = self.parse_residence_year(residence_since)
             else:
                 residence_year = int(residence_since)
-            
-            # Must be residing before 2005 (cut-off date)
-            if residence_year <= 1930:  # 75 years before 2005
-                return 100.0
-            elif residence_year <= 1980:
-                return 80.0
-            elif residence_year <= 2005:
-                return 60.0
-            else:
-                return 10.0
-                
-        except:
+        except (TypeError, ValueError):
             return 30.0  # Default if data unavailable
+        
+        # Must be residing before 2005 (cut-off date); the 1930
+        # threshold is 75 years before it
+        return _RESIDENCE_SCORES[bisect.bisect_left(_RESIDENCE_THRESHOLDS, residence_year)]
+    
+    def parse_residence_year(self, residence_since: str) -> int:
+        """Parse the residence year from a date string
+
+        The first successful parse decides the format (year after the
+        last '/' vs leading year) and caches a specialized parser, so
+        steady-state calls skip the split-then-slice fallback chain.
+        """
+        parser = self._year_parser
+        if parser is not None:
+            try:
+                return parser(residence_since)
+            except ValueError:
+                self._year_parser = None  # Format changed, re-sniff below
+        
+        try:
+            year = int(residence_since.rsplit('/', 1)[-1])
+            self._year_parser = lambda value: int(value.rsplit('/', 1)[-1])
+        except ValueError:
+            year = int(residence_since[:4])
+            self._year_parser = lambda value: int(value[:4])
+        
+        return year
     
     def assess_forest_dependence(self, data: Dict) -> float:
         """Assess forest dependence for livelihood"""
-        try:
-            primary_occupation = data.get('primary_occupation', '').lower()
-            secondary_occupation = data.get('secondary_occupation', '').lower()
-            forest_activities = data.get('forest_activities', [])
-            
-            score = 0
-            
-            # Primary occupation assessment
-            forest_occupations = [
-                'forest produce collection', 'agriculture in forest', 'cattle grazing',
-                'honey collection', 'medicinal plants', 'bamboo collection',
-                'tendu leaf collection', 'sal leaf collection'
-            ]
-            
-            for occupation in forest_occupations:
-                if occupation in primary_occupation:
-                    score += 40
-                    break
-            
-            # Secondary occupation
-            for occupation in forest_occupations:
-                if occupation in secondary_occupation:
-                    score += 20
-                    break
-            
-            # Forest activities
-            if isinstance(forest_activities, list):
-                score += min(len(forest_activities) * 10, 40)
-            
-            return min(score, 100.0)
-            
-        except:
+        primary_occupation = data.get('primary_occupation', '')
+        secondary_occupation = data.get('secondary_occupation', '')
+        forest_activities = data.get('forest_activities', [])
+        
+        if not isinstance(primary_occupation, str) or not isinstance(secondary_occupation, str):
             return 30.0
+        
+        score = 0
+        
+        # Primary occupation assessment
+        if _matches_forest_occupation(primary_occupation.lower()):
+            score += 40
+        
+        # Secondary occupation
+        if _matches_forest_occupation(secondary_occupation.lower()):
+            score += 20
+        
+        # Forest activities
+        if isinstance(forest_activities, list):
+            score += min(len(forest_activities) * 10, 40)
+        
+        return min(score, 100.0)
     
     def assess_documentation(self, data: Dict) -> float:
         """Assess completeness of documentation"""
-        try:
-            documents = data.get('documents', [])
-            required_docs = [
-                'residence_proof', 'community_certificate', 'land_records',
-                'forest_dependence_proof', 'community_resolution'
-            ]
-            
-            if isinstance(documents, list):
-                available_docs = len(documents)
-                score = (available_docs / len(required_docs)) * 100
-            else:
-                score = 50.0  # Default
-            
-            return min(score, 100.0)
-            
-        except:
-            return 30.0
+        documents = data.get('documents', [])
+        required_docs = [
+            'residence_proof', 'community_certificate', 'land_records',
+            'forest_dependence_proof', 'community_resolution'
+        ]
+        
+        if isinstance(documents, list):
+            available_docs = len(documents)
+            score = (available_docs / len(required_docs)) * 100
+        else:
+            score = 50.0  # Default
+        
+        return min(score, 100.0)
     
     def assess_land_use(self, data: Dict) -> float:
         """Assess land use pattern"""
-        try:
-            land_use = data.get('land_use', '').lower()
-            land_type = data.get('land_type', '').lower()
-            
-            score = 0
-            
-            # Land use patterns
-            if 'agriculture' in land_use:
-                score += 40
-            if 'grazing' in land_use:
-                score += 30
-            if 'settlement' in land_use:
-                score += 30
-            
-            # Land type
-            if 'forest' in land_type:
-                score += 30
-            elif 'government' in land_type:
-                score += 20
-            
-            return min(score, 100.0)
-            
-        except:
+        land_use = data.get('land_use', '')
+        land_type = data.get('land_type', '')
+        
+        if not isinstance(land_use, str) or not isinstance(land_type, str):
             return 40.0
+        
+        land_use = land_use.lower()
+        land_type = land_type.lower()
+        
+        score = 0
+        
+        # Land use patterns
+        if 'agriculture' in land_use:
+            score += 40
+        if 'grazing' in land_use:
+            score += 30
+        if 'settlement' in land_use:
+            score += 30
+        
+        # Land type
+        if 'forest' in land_type:
+            score += 30
+        elif 'government' in land_type:
+            score += 20
+        
+        return min(score, 100.0)
     
     def assess_community_support(self, data: Dict) -> float:
         """Assess community support and gram sabha resolution"""
-        try:
-            gram_sabha_resolution = data.get('gram_sabha_resolution', False)
-            community_support = data.get('community_support_letters', 0)
-            
-            score = 0
-            
-            if gram_sabha_resolution:
-                score += 70
-            
-            if isinstance(community_support, int):
-                score += min(community_support * 10, 30)
-            
-            return min(score, 100.0)
-            
-        except:
-            return 20.0
+        gram_sabha_resolution = data.get('gram_sabha_resolution', False)
+        community_support = data.get('community_support_letters', 0)
+        
+        score = 0
+        
+        if gram_sabha_resolution:
+            score += 70
+        
+        if isinstance(community_support, int):
+            score += min(community_support * 10, 30)
+        
+        return min(score, 100.0)
     
     def generate_recommendations(self, assessment: Dict) -> List[str]:
         """Generate recommendations based on assessment"""
@@ -250,46 +481,15 @@ class DecisionSupportSystem:
         scores = assessment.get('scores', {})
         
         try:
-            if scores.get('community_type', 0) < 80:
-                recommendations.append(
-                    "Verify community type with proper tribal/OTFD certificate"
-                )
-            
-            if scores.get('residence_period', 0) < 60:
-                recommendations.append(
-                    "Collect additional evidence of residence before 2005"
-                )
-            
-            if scores.get('forest_dependence', 0) < 60:
-                recommendations.append(
-                    "Document forest-based livelihood activities with evidence"
-                )
-            
-            if scores.get('documentation', 0) < 70:
-                recommendations.append(
-                    "Complete documentation with all required certificates"
-                )
-            
-            if scores.get('community_support', 0) < 70:
-                recommendations.append(
-                    "Obtain Gram Sabha resolution and community support letters"
-                )
+            for criterion, threshold, message in _RECOMMENDATION_RULES:
+                if scores.get(criterion, 0) < threshold:
+                    recommendations.append(message)
             
             # General recommendations
             if assessment.get('overall_score', 0) >= 60:
-                recommendations.append(
-                    "Application has good potential for approval"
-                )
-                recommendations.append(
-                    "Submit to Forest Rights Committee for review"
-                )
+                recommendations.extend(_RECOMMENDATIONS_GOOD)
             else:
-                recommendations.append(
-                    "Strengthen application before submission"
-                )
-                recommendations.append(
-                    "Seek assistance from NGOs or community leaders"
-                )
+                recommendations.extend(_RECOMMENDATIONS_WEAK)
             
             return recommendations
             
@@ -299,31 +499,14 @@ class DecisionSupportSystem:
     
     def identify_missing_documents(self, data: Dict) -> List[str]:
         """Identify missing required documents"""
-        missing = []
-        
         try:
-            documents = data.get('documents', [])
-            required_docs = {
-                'residence_proof': 'Residence proof (ration card, voter ID, etc.)',
-                'community_certificate': 'Scheduled Tribe/OTFD certificate',
-                'land_records': 'Land records and survey settlement',
-                'forest_dependence_proof': 'Forest dependence evidence',
-                'community_resolution': 'Gram Sabha resolution',
-                'identity_proof': 'Identity proof documents',
-                'photographs': 'Recent photographs',
-                'land_sketch': 'Land sketch/map'
-            }
-            
-            if isinstance(documents, list):
-                available = [doc.lower() for doc in documents]
-            else:
-                available = []
-            
-            for doc_key, doc_name in required_docs.items():
-                if not any(doc_key in avail or avail in doc_key for avail in available):
-                    missing.append(doc_name)
+            mask = _document_mask(data.get('documents', []))
             
-            return missing
+            # Missing documents are the zero bits of the mask
+            return [
+                name for key, name in _REQUIRED_DOCS
+                if not mask & _DOC_BITS[key]
+            ]
             
         except Exception as e:
             logger.error(f"Error identifying missing documents: {str(e)}")
@@ -331,55 +514,101 @@ class DecisionSupportSystem:
     
     def suggest_next_steps(self, assessment: Dict) -> List[str]:
         """Suggest next steps based on assessment"""
-        steps = []
-        
         try:
             overall_score = assessment.get('overall_score', 0)
-            status = assessment.get('eligibility_status', '')
             
-            if overall_score >= 80:
-                steps = [
-                    "1. Submit application to Sub-Divisional Level Committee (SDLC)",
-                    "2. Attend field verification if requested",
-                    "3. Present case to District Level Committee (DLC)",
-                    "4. Await final approval and title deed issuance"
-                ]
-            elif overall_score >= 60:
-                steps = [
-                    "1. Review and strengthen weak areas in application",
-                    "2. Collect additional supporting documents",
-                    "3. Submit to SDLC with complete documentation",
-                    "4. Be prepared for field verification"
-                ]
-            elif overall_score >= 40:
-                steps = [
-                    "1. Address major gaps identified in assessment",
-                    "2. Seek assistance from local NGOs or community workers",
-                    "3. Collect missing critical documents",
-                    "4. Re-submit when application is strengthened"
-                ]
-            else:
-                steps = [
-                    "1. Review FRA eligibility criteria carefully",
-                    "2. Seek legal aid or NGO assistance",
-                    "3. Consider alternative land rights schemes if eligible",
-                    "4. Build stronger case with community support"
-                ]
+            # Same thresholds as the eligibility buckets; the bundles
+            # are shared tuples, copied only at the return boundary
+            bundle = _NEXT_STEPS[bisect.bisect_right(_STATUS_THRESHOLDS, overall_score)]
             
-            return steps
+            return list(bundle)
             
         except Exception as e:
             logger.error(f"Error suggesting next steps: {str(e)}")
             return ["Consult with local authorities for guidance"]
     
-    def batch_assessment(self, applications: List[Dict]) -> List[Dict]:
-        """Perform batch assessment of multiple applications"""
+    def batch_assessment(self, applications: List[Dict], workers: int = None) -> List[Dict]:
+        """Perform batch assessment of multiple applications
+
+        With workers set, large batches are split into chunks scored in
+        parallel worker processes; small batches stay serial because
+        pickling would cost more than the scoring.
+        """
         try:
+            if not applications:
+                return []
+
+            if workers and len(applications) >= 256:
+                chunk_size = max(1, len(applications) // (workers * 4))
+                chunks = [applications[i:i + chunk_size] for i in range(0, len(applications), chunk_size)]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return [
+                        assessment
+                        for chunk_results in executor.map(_assess_application_chunk, chunks)
+                        for assessment in chunk_results
+                    ]
+
+            # pandas is only needed for the columnar paths; deferring
+            # the import keeps single-assessment workers light
+            import pandas as pd
+
+            # Score all applications as columns, then assemble the
+            # per-application assessment dicts from the result arrays.
+            # dtype=object keeps the raw values, and absent keys are
+            # marked with a sentinel, so type-sensitive defaults match
+            # the per-record assess_* methods exactly
+            df = pd.DataFrame(
+                [
+                    {column: application.get(column, _MISSING) for column in _BATCH_COLUMNS}
+                    for application in applications
+                ],
+                columns=list(_BATCH_COLUMNS), dtype=object
+            )
+            criteria = list(self.weights.keys())
+            batch_timestamp = datetime.now().isoformat()
+            batch_scores = self.compute_batch_scores(df)
+
+            # float32 halves the score-matrix bandwidth; all score and
+            # weight values are exact multiples of 0.05, so rounding to
+            # two decimals is unaffected
+            scores_matrix = np.column_stack(
+                [batch_scores[criterion] for criterion in criteria]
+            ).astype(np.float32)
+            weight_vector = np.array([self.weights[criterion] for criterion in criteria], dtype=np.float32)
+
+            # Fused weighted-sum + eligibility bucketing; JIT-compiled
+            # when numba is installed, plain NumPy otherwise
+            raw_overall, buckets = weighted_bucket_scores(
+                scores_matrix, weight_vector, np.array(_STATUS_THRESHOLDS)
+            )
+            overall_scores = np.round(raw_overall, 2)
+            statuses = np.array(_STATUS_LABELS)[buckets]
+
             results = []
-            
+            for i, application in enumerate(applications):
+                assessment = {
+                    'application_id': application.get('id', 'N/A'),
+                    'applicant_name': application.get('name', 'N/A'),
+                    'assessment_date': batch_timestamp,
+                    'scores': {criterion: float(scores_matrix[i, j]) for j, criterion in enumerate(criteria)},
+                    'overall_score': round(float(overall_scores[i]), 2),
+                    'eligibility_status': str(statuses[i])
+                }
+                assessment['recommendations'] = self.generate_recommendations(assessment)
+                assessment['missing_documents'] = self.identify_missing_documents(application)
+                assessment['next_steps'] = self.suggest_next_steps(assessment)
+                results.append(assessment)
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Error in vectorized batch assessment, falling back to per-record scoring: {str(e)}")
+            results = []
+
+            batch_timestamp = datetime.now().isoformat()
             for application in applications:
                 try:
-                    result = self.assess_eligibility(application)
+                    result = self.assess_eligibility(application, batch_timestamp)
                     results.append(result)
                 except Exception as e:
                     logger.error(f"Error assessing application {application.get('id', 'N/A')}: {str(e)}")
@@ -389,10 +618,162 @@ class DecisionSupportSystem:
                     })
             
             return results
-            
-        except Exception as e:
-            logger.error(f"Error in batch assessment: {str(e)}")
-            return []
+
+    def compute_batch_scores(self, df: 'pd.DataFrame') -> Dict:
+        """Compute the six criterion score columns for a batch of applications
+
+        Each criterion mirrors the corresponding assess_* method, but runs
+        as one vectorized transform per column instead of per-record
+        calls. batch_assessment marks keys absent from an application
+        with the _MISSING sentinel so they take the scalar data.get
+        defaults, distinct from explicitly supplied None/NaN values.
+        """
+        import pandas as pd
+
+        # Columns missing entirely read as all-missing; note that a raw
+        # NaN cell in a frame built without the _MISSING sentinel is
+        # treated as an explicit invalid value, not an absent key
+        df = df.reindex(columns=list(_BATCH_COLUMNS), fill_value=_MISSING)
+
+        def string_column(column):
+            # Real strings pass through; everything else reads as the
+            # '' default (rows the scalar guards reject get their
+            # default scores overlaid below)
+            values = df[column]
+            return values.where(values.apply(lambda value: isinstance(value, str)), '')
+
+        def invalid_mask(column):
+            # Rows where the scalar guard clauses bail with a default
+            # score: the key is present but the value is not a string
+            # (explicit None/NaN included)
+            return df[column].apply(
+                lambda value: not isinstance(value, str) and value is not _MISSING
+            ).to_numpy(dtype=bool)
+
+        # Batch-normalize the string columns once; every criterion
+        # below reads these
+        community = string_column('community_type').str.strip()
+        primary = string_column('primary_occupation').str.lower()
+        secondary = string_column('secondary_occupation').str.lower()
+        land_use = string_column('land_use').str.lower()
+        land_type = string_column('land_type').str.lower()
+
+        # Community type
+        community_score = community.map({
+            'Scheduled Tribes': 100.0, 'ST': 100.0,
+            'Primitive Tribal Groups': 100.0, 'PTG': 100.0,
+            'Other Traditional Forest Dwellers': 90.0, 'OTFD': 90.0
+        })
+        tribal = community.str.lower().str.contains('tribal', regex=False).to_numpy()
+        community_score = community_score.where(
+            community_score.notna(), np.where(tribal, 85.0, 20.0)
+        ).to_numpy(dtype=float)
+        community_score = np.where(invalid_mask('community_type'), 0.0, community_score)
+
+        # Residence period: every row goes through the scalar parse
+        # chain, so batch and scalar bucket identically for any input
+        years = df['residence_since'].apply(_parse_year).to_numpy(dtype=float)
+        residence_score = np.take(
+            _RESIDENCE_SCORES, np.searchsorted(_RESIDENCE_THRESHOLDS, years, side='left')
+        )
+        residence_score = np.where(np.isnan(years), 30.0, residence_score)
+
+        # Forest dependence
+        occupation_pattern = self._forest_occ_re.pattern
+        activities = df['forest_activities'].apply(
+            lambda value: len(value) if isinstance(value, list) else 0
+        ).to_numpy(dtype=float)
+        forest_score = (
+            primary.str.contains(occupation_pattern).to_numpy() * 40.0
+            + secondary.str.contains(occupation_pattern).to_numpy() * 20.0
+            + np.minimum(activities * 10.0, 40.0)
+        )
+        forest_score = np.minimum(forest_score, 100.0)
+        forest_score = np.where(
+            invalid_mask('primary_occupation') | invalid_mask('secondary_occupation'),
+            30.0, forest_score
+        )
+
+        # Documentation
+        document_counts = pd.to_numeric(df['documents'].apply(
+            # A missing key means the scalar default empty list; any
+            # present non-list value keeps the 50.0 default via NaN
+            lambda value: len(value) if isinstance(value, list)
+            else (0 if value is _MISSING else None)
+        ), errors='coerce').to_numpy(dtype=float)
+        documentation_score = np.minimum(document_counts / 5 * 100, 100.0)
+        documentation_score = np.where(np.isnan(document_counts), 50.0, documentation_score)
+
+        # Land use
+        land_score = (
+            land_use.str.contains('agriculture', regex=False).to_numpy() * 40.0
+            + land_use.str.contains('grazing', regex=False).to_numpy() * 30.0
+            + land_use.str.contains('settlement', regex=False).to_numpy() * 30.0
+            + np.where(
+                land_type.str.contains('forest', regex=False).to_numpy(), 30.0,
+                np.where(land_type.str.contains('government', regex=False).to_numpy(), 20.0, 0.0)
+            )
+        )
+        land_score = np.minimum(land_score, 100.0)
+        land_score = np.where(
+            invalid_mask('land_use') | invalid_mask('land_type'), 40.0, land_score
+        )
+
+        # Community support; scalar truthiness applies to any present
+        # value, while a missing key is the False default
+        gram_sabha = df['gram_sabha_resolution'].apply(
+            lambda value: value is not _MISSING and bool(value)
+        ).to_numpy(dtype=bool)
+        support_letters = df['community_support_letters'].apply(
+            lambda value: min(value * 10, 30) if isinstance(value, (int, np.integer)) else 0
+        ).to_numpy(dtype=float)
+        support_score = np.minimum(gram_sabha * 70.0 + support_letters, 100.0)
+
+        return {
+            'community_type': community_score,
+            'residence_period': residence_score,
+            'forest_dependence': forest_score,
+            'documentation': documentation_score,
+            'land_use': land_score,
+            'community_support': support_score
+        }
+    
+    def iter_batch_assessment(self, applications: List[Dict]):
+        """Yield assessments one at a time for low-memory batch processing
+
+        Uses the per-record scoring path so only one assessment dict is
+        alive at a time; batch_assessment remains the fast columnar
+        variant for callers that want the full list.
+        """
+        batch_timestamp = datetime.now().isoformat()
+        
+        for application in applications:
+            try:
+                yield self.assess_eligibility(application, batch_timestamp)
+            except Exception as e:
+                logger.error(f"Error assessing application {application.get('id', 'N/A')}: {str(e)}")
+                yield {
+                    'application_id': application.get('id', 'N/A'),
+                    'error': str(e)
+                }
+    
+    def batch_assessment_to_jsonl(self, applications: List[Dict], path: str) -> int:
+        """Stream batch assessment results to a JSON-lines file
+
+        Writes one record per line as it is produced instead of
+        buffering the whole result list; returns the record count.
+        """
+        count = 0
+        
+        with open(path, 'wb') as f:
+            for assessment in self.iter_batch_assessment(applications):
+                if ORJSON_AVAILABLE:
+                    f.write(orjson.dumps(assessment) + b'\n')
+                else:
+                    f.write(json.dumps(assessment).encode('utf-8') + b'\n')
+                count += 1
+        
+        return count
     
     def generate_summary_report(self, assessments: List[Dict]) -> Dict:
         """Generate summary report from multiple assessments"""
@@ -402,48 +783,35 @@ class DecisionSupportSystem:
             if total_applications == 0:
                 return {'error': 'No assessments provided'}
             
+            valid = [a for a in assessments if 'error' not in a]
+
+            # Status counts
             status_counts = {}
-            score_distribution = {'0-20': 0, '21-40': 0, '41-60': 0, '61-80': 0, '81-100': 0}
-            avg_scores = {}
-            
-            # Analyze assessments
-            total_score = 0
-            criterion_totals = {}
-            
-            for assessment in assessments:
-                if 'error' not in assessment:
-                    # Status counts
-                    status = assessment.get('eligibility_status', 'Unknown')
-                    status_counts[status] = status_counts.get(status, 0) + 1
-                    
-                    # Score distribution
-                    score = assessment.get('overall_score', 0)
-                    total_score += score
-                    
-                    if score <= 20:
-                        score_distribution['0-20'] += 1
-                    elif score <= 40:
-                        score_distribution['21-40'] += 1
-                    elif score <= 60:
-                        score_distribution['41-60'] += 1
-                    elif score <= 80:
-                        score_distribution['61-80'] += 1
-                    else:
-                        score_distribution['81-100'] += 1
-                    
-                    # Criterion scores
-                    scores = assessment.get('scores', {})
-                    for criterion, score in scores.items():
-                        if criterion not in criterion_totals:
-                            criterion_totals[criterion] = []
-                        criterion_totals[criterion].append(score)
+            for assessment in valid:
+                status = assessment.get('eligibility_status', 'Unknown')
+                status_counts[status] = status_counts.get(status, 0) + 1
+
+            # One digitize/bincount pass replaces the per-record
+            # if/elif score-bucket ladder
+            scores_arr = np.fromiter(
+                (a.get('overall_score', 0) for a in valid), dtype=np.float64, count=len(valid)
+            )
+            buckets = np.bincount(
+                np.digitize(scores_arr, [20, 40, 60, 80], right=True), minlength=5
+            )
+            score_distribution = dict(zip(
+                ('0-20', '21-40', '41-60', '61-80', '81-100'), buckets.tolist()
+            ))
+
+            # Criterion averages: one column-wise mean over the stacked
+            # score dicts instead of per-criterion list appends
+            import pandas as pd
+            criterion_frame = pd.DataFrame([a.get('scores', {}) for a in valid])
+            avg_scores = criterion_frame.mean().to_dict() if not criterion_frame.empty else {}
             
             # Calculate averages
             valid_assessments = total_applications - status_counts.get('error', 0)
-            avg_overall_score = total_score / valid_assessments if valid_assessments > 0 else 0
-            
-            for criterion, scores in criterion_totals.items():
-                avg_scores[criterion] = sum(scores) / len(scores) if scores else 0
+            avg_overall_score = float(scores_arr.sum()) / valid_assessments if valid_assessments > 0 else 0
             
             return {
                 'total_applications': total_applications,
@@ -457,4 +825,4 @@ class DecisionSupportSystem:
             
         except Exception as e:
             logger.error(f"Error generating summary report: {str(e)}")
-            return {'error': str(e)}
\ No newline at end of file
+            return {'error': str(e)}
@@ -3,15 +3,42 @@ GIS Processor Module
 Handles geospatial analysis for FRA implementation
 """
 
+import functools
 import json
+import math
+import zlib
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
 import logging
 import os
 
+from ._kernels import haversine_matrix
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from sklearn.neighbors import BallTree
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
+def get_gis_processor() -> 'GISProcessor':
+    """Get the shared GISProcessor instance
+
+    The district tables, priority arrays and spatial index are static,
+    so one processor serves the whole process.
+    """
+    return GISProcessor()
+
 class GISProcessor:
     def __init__(self):
         """Initialize GIS processor"""
@@ -72,20 +99,68 @@ class GISProcessor:
             'Nuapada': 35.2, 'Puri': 1.8, 'Rayagada': 56.4, 'Sambalpur': 46.2,
             'Sonepur': 24.7, 'Sundargarh': 50.7
         }
+
+        # Columnar views over the district tables with the weighted
+        # priority precomputed once, so priority queries are a single
+        # index lookup instead of per-call arithmetic
+        self._districts = np.array(list(self.district_coordinates))
+        self._district_idx = {district: i for i, district in enumerate(self._districts)}
+        self._forest = np.array([self.forest_cover[d] for d in self._districts])
+        self._tribal = np.array([self.tribal_population[d] for d in self._districts])
+        # Higher forest cover and tribal population = higher priority
+        self._priority = np.round(self._forest * 0.6 + self._tribal * 0.4, 2)
+
+        # District centers in radians for bulk great-circle math
+        self._district_lat_rad = np.radians([self.district_coordinates[d]['lat'] for d in self._districts])
+        self._district_lng_rad = np.radians([self.district_coordinates[d]['lng'] for d in self._districts])
+
+        # Haversine spatial index over district centers for nearest-
+        # district queries; falls back to one brute-force kernel pass
+        # when scikit-learn is not installed
+        self._district_tree = BallTree(
+            np.column_stack([self._district_lat_rad, self._district_lng_rad]), metric='haversine'
+        ) if SKLEARN_AVAILABLE else None
+
+        # Exact lowercase lookup for the common case, plus a memo so
+        # repeated fuzzy queries skip the substring scan
+        self._district_lower = {district.lower(): district for district in self.district_coordinates}
+        self._fuzzy_name_cache = {}
+
+        # identify_potential_areas is deterministic (seeded RNG over
+        # static tables), so its result is computed at most once
+        self._potential_areas_cache = None
+    
+    def resolve_district_name(self, district_name: str) -> str:
+        """Resolve a raw district name to its canonical table key"""
+        name_lower = district_name.lower()
+        
+        canonical = self._district_lower.get(name_lower)
+        if canonical is not None:
+            return canonical
+        
+        if name_lower in self._fuzzy_name_cache:
+            return self._fuzzy_name_cache[name_lower]
+        
+        # Try to find similar district name
+        match = None
+        for district_lower, district in self._district_lower.items():
+            if name_lower in district_lower or district_lower in name_lower:
+                match = district
+                break
+        
+        # Bounded memo - queries are user input, so don't let misses
+        # accumulate without limit
+        if len(self._fuzzy_name_cache) >= 1024:
+            self._fuzzy_name_cache.clear()
+        self._fuzzy_name_cache[name_lower] = match
+        return match
     
     def get_district_info(self, district_name: str) -> Dict:
         """Get comprehensive information about a district"""
         try:
-            district_name = district_name.title()
-            
-            if district_name not in self.district_coordinates:
-                # Try to find similar district name
-                for dist in self.district_coordinates.keys():
-                    if district_name.lower() in dist.lower() or dist.lower() in district_name.lower():
-                        district_name = dist
-                        break
+            district_name = self.resolve_district_name(district_name)
             
-            if district_name in self.district_coordinates:
+            if district_name is not None:
                 return {
                     'name': district_name,
                     'coordinates': self.district_coordinates[district_name],
@@ -103,14 +178,11 @@ class GISProcessor:
     def calculate_fra_priority(self, district_name: str) -> float:
         """Calculate FRA implementation priority score"""
         try:
-            forest_cover = self.forest_cover.get(district_name, 0)
-            tribal_pop = self.tribal_population.get(district_name, 0)
+            index = self._district_idx.get(district_name)
+            if index is None:
+                return 0.0
             
-            # Weighted priority score
-            # Higher forest cover and tribal population = higher priority
-            priority_score = (forest_cover * 0.6) + (tribal_pop * 0.4)
-            
-            return round(priority_score, 2)
+            return float(self._priority[index])
             
         except Exception as e:
             logger.error(f"Error calculating priority for {district_name}: {str(e)}")
@@ -119,16 +191,24 @@ class GISProcessor:
     def identify_potential_areas(self) -> List[Dict]:
         """Identify potential areas for FRA implementation"""
         try:
+            if self._potential_areas_cache is not None:
+                return self._potential_areas_cache
+            
             potential_areas = []
             
-            for district, coords in self.district_coordinates.items():
+            # One vectorized comparison selects the qualifying districts
+            for index in np.where(self._priority > 30)[0]:
+                district = str(self._districts[index])
                 district_info = self.get_district_info(district)
                 
-                if district_info and district_info['fra_priority_score'] > 30:
+                if district_info:
                     # Generate potential village points around district center
-                    villages = self.generate_village_points(district, coords, district_info)
+                    villages = self.generate_village_points(
+                        district, self.district_coordinates[district], district_info
+                    )
                     potential_areas.extend(villages)
             
+            self._potential_areas_cache = potential_areas
             return potential_areas
             
         except Exception as e:
@@ -138,38 +218,39 @@ class GISProcessor:
     def generate_village_points(self, district: str, center_coords: Dict, district_info: Dict) -> List[Dict]:
         """Generate potential village points for FRA implementation"""
         try:
-            villages = []
             priority_score = district_info['fra_priority_score']
             
             # Number of potential villages based on priority
             num_villages = max(3, int(priority_score / 10))
             
-            # Generate random points around district center
-            np.random.seed(hash(district) % 1000)  # Consistent random for same district
+            # Draw every random field for the district in one batch from
+            # a local generator instead of mutating np.random global
+            # state once per value
+            # crc32 keeps the seed stable across interpreter runs (str
+            # hash() is randomized) and unique per district name
+            rng = np.random.default_rng(zlib.crc32(district.encode()))  # Consistent random for same district
+            offsets = rng.uniform(-0.5, 0.5, size=(num_villages, 2))  # ~50km radius
+            beneficiaries = rng.integers(50, 500, size=num_villages)
+            proximities = rng.uniform(0.1, 2.0, size=num_villages)  # km
+            households = rng.integers(20, 200, size=num_villages)
             
-            for i in range(num_villages):
-                # Random offset within ~50km radius
-                lat_offset = np.random.uniform(-0.5, 0.5)
-                lng_offset = np.random.uniform(-0.5, 0.5)
-                
-                village = {
+            return [
+                {
                     'id': f"{district}_potential_{i+1}",
                     'name': f"Potential Area {i+1}",
                     'district': district,
                     'coordinates': {
-                        'lat': center_coords['lat'] + lat_offset,
-                        'lng': center_coords['lng'] + lng_offset
+                        'lat': center_coords['lat'] + offsets[i, 0],
+                        'lng': center_coords['lng'] + offsets[i, 1]
                     },
                     'type': 'potential',
                     'priority_score': priority_score,
-                    'estimated_beneficiaries': np.random.randint(50, 500),
-                    'forest_proximity': np.random.uniform(0.1, 2.0),  # km
-                    'tribal_households': np.random.randint(20, 200)
+                    'estimated_beneficiaries': int(beneficiaries[i]),
+                    'forest_proximity': float(proximities[i]),
+                    'tribal_households': int(households[i])
                 }
-                
-                villages.append(village)
-            
-            return villages
+                for i in range(num_villages)
+            ]
             
         except Exception as e:
             logger.error(f"Error generating village points for {district}: {str(e)}")
@@ -178,28 +259,26 @@ class GISProcessor:
     def create_district_geojson(self, district_data: Dict) -> Dict:
         """Create GeoJSON for district visualization"""
         try:
-            features = []
-            
-            for district, info in district_data.items():
-                if 'coordinates' in info:
-                    feature = {
-                        'type': 'Feature',
-                        'properties': {
-                            'name': district,
-                            'forest_cover': info.get('forest_cover_percent', 0),
-                            'tribal_population': info.get('tribal_population_percent', 0),
-                            'priority_score': info.get('fra_priority_score', 0),
-                            'beneficiaries_count': info.get('beneficiaries_count', 0)
-                        },
-                        'geometry': {
-                            'type': 'Point',
-                            'coordinates': [
-                                info['coordinates']['lng'],
-                                info['coordinates']['lat']
-                            ]
-                        }
+            features = [
+                {
+                    'type': 'Feature',
+                    'properties': {
+                        'name': district,
+                        'forest_cover': info.get('forest_cover_percent', 0),
+                        'tribal_population': info.get('tribal_population_percent', 0),
+                        'priority_score': info.get('fra_priority_score', 0),
+                        'beneficiaries_count': info.get('beneficiaries_count', 0)
+                    },
+                    'geometry': {
+                        'type': 'Point',
+                        'coordinates': [
+                            info['coordinates']['lng'],
+                            info['coordinates']['lat']
+                        ]
                     }
-                    features.append(feature)
+                }
+                for district, info in district_data.items() if 'coordinates' in info
+            ]
             
             return {
                 'type': 'FeatureCollection',
@@ -213,22 +292,36 @@ class GISProcessor:
     def analyze_coverage_gap(self, beneficiary_data: List[Dict]) -> Dict:
         """Analyze gaps in FRA coverage"""
         try:
-            # Get districts with beneficiaries
-            covered_districts = set()
-            district_counts = {}
+            district_names = [beneficiary.get('district', '') for beneficiary in beneficiary_data]
             
-            for beneficiary in beneficiary_data:
-                district = beneficiary.get('district', '').title()
-                if district:
-                    covered_districts.add(district)
-                    district_counts[district] = district_counts.get(district, 0) + 1
+            # Beneficiaries with GPS coordinates but no district are
+            # assigned to the nearest district center
+            unassigned = [
+                (i, coords) for i, beneficiary in enumerate(beneficiary_data)
+                if not district_names[i]
+                for coords in [beneficiary.get('coordinates')]
+                if isinstance(coords, dict) and 'lat' in coords and 'lng' in coords
+            ]
+            if unassigned:
+                names, _ = self.nearest_districts(
+                    [coords['lat'] for _, coords in unassigned],
+                    [coords['lng'] for _, coords in unassigned]
+                )
+                for (i, _), name in zip(unassigned, names):
+                    district_names[i] = name
+            
+            # Count beneficiaries per district in one vectorized pass
+            districts = pd.Series(district_names, dtype='object').str.title()
+            district_counts = {k: int(v) for k, v in districts[districts != ''].value_counts().items()}
+            covered_districts = set(district_counts)
             
             # Identify uncovered high-priority districts
             uncovered_priority = []
             low_coverage = []
             
-            for district in self.district_coordinates.keys():
-                priority_score = self.calculate_fra_priority(district)
+            for index, district in enumerate(self._districts):
+                district = str(district)
+                priority_score = float(self._priority[index])
                 
                 if district not in covered_districts and priority_score > 40:
                     uncovered_priority.append({
@@ -258,9 +351,10 @@ class GISProcessor:
     def get_buffer_zones(self, coordinates: Dict, radius_km: float = 5) -> Dict:
         """Get buffer zone around coordinates"""
         try:
-            # Simple buffer calculation (approximate)
+            # Simple buffer calculation (approximate); math trig on a
+            # scalar skips the NumPy ufunc dispatch overhead
             lat_offset = radius_km / 111.0  # Approx km per degree latitude
-            lng_offset = radius_km / (111.0 * abs(np.cos(np.radians(coordinates['lat']))))
+            lng_offset = radius_km / (111.0 * abs(math.cos(math.radians(coordinates['lat']))))
             
             return {
                 'center': coordinates,
@@ -277,14 +371,78 @@ class GISProcessor:
             logger.error(f"Error calculating buffer zone: {str(e)}")
             return {'center': coordinates, 'radius_km': radius_km, 'bounds': {}}
     
+    def district_distances(self, lats, lngs) -> np.ndarray:
+        """Great-circle distances from points to every district center
+
+        Returns a (points, districts) array of kilometres, computed in
+        one fused kernel pass (numba when available, NumPy otherwise).
+        """
+        lats = np.radians(np.asarray(lats, dtype=float))
+        lngs = np.radians(np.asarray(lngs, dtype=float))
+        
+        return haversine_matrix(lats, lngs, self._district_lat_rad, self._district_lng_rad)
+    
+    def nearest_districts(self, lats, lngs) -> Tuple[List[str], np.ndarray]:
+        """Find the nearest district center for arrays of points
+
+        Returns (district names, distances in km). Queries the BallTree
+        index when available, else one brute-force haversine pass.
+        """
+        lats = np.asarray(lats, dtype=float)
+        lngs = np.asarray(lngs, dtype=float)
+        
+        if self._district_tree is not None:
+            distances, indices = self._district_tree.query(
+                np.radians(np.column_stack([lats, lngs])), k=1
+            )
+            distances = distances[:, 0] * 6371.0
+            indices = indices[:, 0]
+        else:
+            matrix = self.district_distances(lats, lngs)
+            indices = matrix.argmin(axis=1)
+            distances = matrix[np.arange(len(indices)), indices]
+        
+        return [str(self._districts[i]) for i in indices], distances
+    
+    def nearest_district(self, lat: float, lng: float) -> Tuple[str, float]:
+        """Find the nearest district center to a single point"""
+        names, distances = self.nearest_districts([lat], [lng])
+        return names[0], float(distances[0])
+    
+    def get_buffer_zones_bulk(self, lats, lngs, radius_km: float = 5) -> Dict:
+        """Get buffer zone bounds for arrays of coordinates
+
+        Computes every bound in one broadcast instead of one
+        get_buffer_zones call per point.
+        """
+        try:
+            lats = np.asarray(lats, dtype=float)
+            lngs = np.asarray(lngs, dtype=float)
+            
+            lat_offset = radius_km / 111.0
+            lng_offsets = radius_km / (111.0 * np.abs(np.cos(np.radians(lats))))
+            
+            return {
+                'radius_km': radius_km,
+                'bounds': {
+                    'north': lats + lat_offset,
+                    'south': lats - lat_offset,
+                    'east': lngs + lng_offsets,
+                    'west': lngs - lng_offsets
+                }
+            }
+            
+        except Exception as e:
+            logger.error(f"Error calculating bulk buffer zones: {str(e)}")
+            return {'radius_km': radius_km, 'bounds': {}}
+    
     def export_to_geojson(self, data: List[Dict], filename: str) -> str:
         """Export data to GeoJSON file"""
         try:
-            features = []
-            
-            for item in data:
-                if 'coordinates' in item:
-                    feature = {
+            geojson = {
+                'type': 'FeatureCollection',
+                'features': [
+                    {
                         'type': 'Feature',
                         'properties': {k: v for k, v in item.items() if k != 'coordinates'},
                         'geometry': {
@@ -292,22 +450,23 @@ class GISProcessor:
                             'coordinates': [item['coordinates']['lng'], item['coordinates']['lat']]
                         }
                     }
-                    features.append(feature)
-            
-            geojson = {
-                'type': 'FeatureCollection',
-                'features': features
+                    for item in data if 'coordinates' in item
+                ]
             }
             
             # Save to file
             filepath = os.path.join('data', f"{filename}.geojson")
             os.makedirs('data', exist_ok=True)
             
-            with open(filepath, 'w') as f:
-                json.dump(geojson, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(geojson, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(geojson, f, indent=2)
             
             return filepath
             
         except Exception as e:
             logger.error(f"Error exporting to GeoJSON: {str(e)}")
-            raise
\ No newline at end of file
+            raise
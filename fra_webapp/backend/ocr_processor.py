@@ -3,70 +3,60 @@ OCR Processor Module
 Handles optical character recognition for legacy FRA documents
 """
 
-try:
-    import cv2
-    import pytesseract
-    import numpy as np
-    from PIL import Image
-    import fitz  # PyMuPDF
-    TESSERACT_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: OCR dependencies not available: {e}")
-    TESSERACT_AVAILABLE = False
-    # Create mock classes for missing dependencies
-    class MockImage:
-        @staticmethod
-        def open(path): return None
-        @staticmethod
-        def fromarray(arr): return None
-    class MockCV2:
-        @staticmethod
-        def imread(path, flag=None): return None
-        @staticmethod
-        def cvtColor(img, flag): return None
-        @staticmethod
-        def threshold(img, t1, t2, t3): return None, None
-        @staticmethod
-        def GaussianBlur(img, k, s): return None
-        @staticmethod
-        def morphologyEx(img, op, kernel): return None
-        @staticmethod
-        def getStructuringElement(shape, size): return None
-        IMREAD_COLOR = 1
-        COLOR_BGR2GRAY = 7
-        THRESH_BINARY = 0
-        THRESH_OTSU = 8
-        MORPH_CLOSE = 3
-        MORPH_RECT = 0
-    class MockTesseract:
-        @staticmethod
-        def image_to_string(img, config=None): return "Mock OCR Result"
-    class MockFitz:
-        @staticmethod
-        def open(path): return MockPDF()
-    class MockPDF:
-        def __len__(self): return 1
-        def __getitem__(self, i): return MockPage()
-        def close(self): pass
-    class MockPage:
-        def get_pixmap(self): return MockPixmap()
-    class MockPixmap:
-        def tobytes(self, fmt): return b""
-    
-    if not TESSERACT_AVAILABLE:
-        cv2 = MockCV2()
-        pytesseract = MockTesseract()
-        np = type('MockNumpy', (), {'array': lambda x: x, 'uint8': int})()
-        Image = MockImage()
-        fitz = MockFitz()
-
-import pandas as pd
+import os
 import re
+import types
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from typing import Dict, List, Tuple, Any
 
 logger = logging.getLogger(__name__)
 
+# The heavy OCR stack (cv2 alone costs hundreds of ms and tens of MB)
+# is imported on first use so processes that never touch OCR skip it
+_OCR_DEPS = None
+_OCR_DEPS_FAILED = False
+
+def _load_ocr_dependencies():
+    """Import the OCR dependencies on first use
+
+    Returns a namespace with the modules, or None when they are not
+    installed (callers fall back to mock results, as before).
+    """
+    global _OCR_DEPS, _OCR_DEPS_FAILED
+    
+    if _OCR_DEPS is None and not _OCR_DEPS_FAILED:
+        try:
+            import cv2
+            import numpy as np
+            import pytesseract
+            import fitz  # PyMuPDF
+            from PIL import Image
+            _OCR_DEPS = types.SimpleNamespace(
+                cv2=cv2, np=np, pytesseract=pytesseract, fitz=fitz, Image=Image
+            )
+        except ImportError as e:
+            logger.warning(f"OCR dependencies not available: {e}")
+            _OCR_DEPS_FAILED = True
+    
+    return _OCR_DEPS
+
+# Shared Tesseract configuration for image and PDF-fallback OCR
+_TESSERACT_CONFIG = r'--oem 3 --psm 6 -l eng+hin'
+
+# Date formats recognized by standardize_date, compiled once
+_DATE_PATTERNS = (
+    re.compile(r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})'),
+    re.compile(r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2})'),
+    re.compile(r'(\d{4})[\/\-](\d{1,2})[\/\-](\d{1,2})')
+)
+
+# Field-cleanup character classes, compiled once at import
+_NON_ALPHA_SPACE_RE = re.compile(r'[^A-Za-z\s]')
+_NON_SURVEY_RE = re.compile(r'[^0-9\/\-]')
+_NON_AREA_RE = re.compile(r'[^0-9.]')
+
 class OCRProcessor:
     def __init__(self):
         """Initialize OCR processor"""
@@ -84,14 +74,33 @@ class OCRProcessor:
             'claim_type': r'(?:Claim Type|दावा प्रकार)[:.]?\s*([A-Za-z\s]+)',
             'date': r'(?:Date|दिनांक)[:.]?\s*([0-9\/\-]+)'
         }
+        
+        # Compiled once with the flags baked in; extraction reuses
+        # these instead of recompiling eight patterns per document
+        self._compiled_patterns = {
+            field: re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+            for field, pattern in self.patterns.items()
+        }
+        
+        # Constants for confidence scoring
+        self._total_patterns = len(self.patterns)
+        self._critical_fields = frozenset({'name', 'village', 'district'})
+        
+        # Extension -> extractor dispatch
+        self._extractors = {'pdf': self.extract_text_from_pdf}
+        for image_extension in ('png', 'jpg', 'jpeg', 'tiff', 'tif'):
+            self._extractors[image_extension] = self.extract_text_from_image
     
     def preprocess_image(self, image_path: str) -> Any:
         """Preprocess image for better OCR results"""
-        if not TESSERACT_AVAILABLE:
+        deps = _load_ocr_dependencies()
+        if deps is None:
             logger.warning("OCR dependencies not available, returning mock result")
             return None
             
         try:
+            cv2 = deps.cv2
+            
             # Read image
             img = cv2.imread(image_path)
             if img is None:
@@ -106,12 +115,10 @@ class OCRProcessor:
             # Apply threshold to get binary image
             _, thresh = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
             
-            # Morphological operations to clean up
-            kernel = np.ones((1, 1), np.uint8)
-            processed = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
-            processed = cv2.morphologyEx(processed, cv2.MORPH_OPEN, kernel)
-            
-            return processed
+            # The old morphologyEx close/open pass used a 1x1 kernel,
+            # which cannot change any pixel - dropped along with its two
+            # full-size intermediate copies
+            return thresh
             
         except Exception as e:
             logger.error(f"Error preprocessing image {image_path}: {str(e)}")
@@ -119,7 +126,8 @@ class OCRProcessor:
     
     def extract_text_from_image(self, image_path: str) -> str:
         """Extract text from image using OCR"""
-        if not TESSERACT_AVAILABLE:
+        deps = _load_ocr_dependencies()
+        if deps is None:
             logger.warning("OCR dependencies not available, returning sample FRA data")
             return """
             Name: Sample Beneficiary
@@ -136,11 +144,8 @@ class OCRProcessor:
             # Preprocess image
             processed_img = self.preprocess_image(image_path)
             
-            # Configure OCR
-            custom_config = r'--oem 3 --psm 6 -l eng+hin'
-            
             # Extract text
-            text = pytesseract.image_to_string(processed_img, config=custom_config)
+            text = deps.pytesseract.image_to_string(processed_img, config=_TESSERACT_CONFIG)
             
             return text.strip()
             
@@ -150,7 +155,8 @@ class OCRProcessor:
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF document"""
-        if not TESSERACT_AVAILABLE:
+        deps = _load_ocr_dependencies()
+        if deps is None:
             logger.warning("OCR dependencies not available, returning sample FRA data")
             return """
             Forest Rights Act - Beneficiary List
@@ -167,17 +173,25 @@ class OCRProcessor:
             
         try:
             text = ""
-            doc = fitz.open(pdf_path)
+            doc = deps.fitz.open(pdf_path)
             
             for page_num in range(len(doc)):
                 page = doc.load_page(page_num)
-                text += page.get_text()
+                page_text = page.get_text()
                 
-                # If no text found, try OCR on page image
-                if not text.strip():
-                    pix = page.get_pixmap()
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                    text += pytesseract.image_to_string(img, lang='eng+hin')
+                if page_text.strip():
+                    text += page_text
+                else:
+                    # No extractable text on this page - rasterize and
+                    # OCR just this page. The old check looked at the
+                    # accumulated text, so scanned pages after the first
+                    # text page were silently skipped.
+                    # Grayscale is enough for text OCR (a third of the
+                    # RGB bytes) and pytesseract takes the numpy array
+                    # directly, skipping the PIL round-trip copy
+                    pix = page.get_pixmap(colorspace=deps.fitz.csGRAY, dpi=200)
+                    img = deps.np.frombuffer(pix.samples, dtype=deps.np.uint8).reshape(pix.height, pix.width)
+                    text += deps.pytesseract.image_to_string(img, config=_TESSERACT_CONFIG)
             
             doc.close()
             return text.strip()
@@ -191,9 +205,8 @@ class OCRProcessor:
         try:
             extracted_data = {}
             
-            for field, pattern in self.patterns.items():
-                matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
-                for match in matches:
+            for field, pattern in self._compiled_patterns.items():
+                for match in pattern.finditer(text):
                     if match.group(1).strip():
                         extracted_data[field] = match.group(1).strip()
                         break
@@ -214,7 +227,7 @@ class OCRProcessor:
         for key, value in data.items():
             if key in ['name', 'father_name', 'village']:
                 # Clean names and places
-                cleaned_value = re.sub(r'[^A-Za-z\s]', '', value).strip()
+                cleaned_value = _NON_ALPHA_SPACE_RE.sub('', value).strip()
                 if len(cleaned_value) > 2:
                     cleaned[key] = cleaned_value.title()
             
@@ -226,14 +239,14 @@ class OCRProcessor:
             
             elif key == 'survey_number':
                 # Clean survey numbers
-                cleaned_value = re.sub(r'[^0-9\/\-]', '', value).strip()
+                cleaned_value = _NON_SURVEY_RE.sub('', value).strip()
                 if cleaned_value:
                     cleaned[key] = cleaned_value
             
             elif key == 'area':
                 # Extract and validate area
                 try:
-                    area_value = float(re.sub(r'[^0-9.]', '', value))
+                    area_value = float(_NON_AREA_RE.sub('', value))
                     if 0 < area_value < 1000:  # Reasonable area limits
                         cleaned[key] = area_value
                 except:
@@ -254,15 +267,8 @@ class OCRProcessor:
     def standardize_date(self, date_str: str) -> str:
         """Standardize date format"""
         try:
-            # Common date patterns
-            patterns = [
-                r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})',
-                r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2})',
-                r'(\d{4})[\/\-](\d{1,2})[\/\-](\d{1,2})'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, date_str)
+            for pattern in _DATE_PATTERNS:
+                match = pattern.search(date_str)
                 if match:
                     if len(match.group(3)) == 2:
                         year = '20' + match.group(3)
@@ -279,15 +285,14 @@ class OCRProcessor:
     def process_document(self, file_path: str) -> Dict:
         """Main method to process a document"""
         try:
-            file_extension = file_path.lower().split('.')[-1]
+            file_extension = os.path.splitext(file_path)[1].lower().lstrip('.')
             
-            if file_extension == 'pdf':
-                text = self.extract_text_from_pdf(file_path)
-            elif file_extension in ['png', 'jpg', 'jpeg', 'tiff', 'tif']:
-                text = self.extract_text_from_image(file_path)
-            else:
+            extract_text = self._extractors.get(file_extension)
+            if extract_text is None:
                 raise ValueError(f"Unsupported file format: {file_extension}")
             
+            text = extract_text(file_path)
+            
             # Extract structured data
             structured_data = self.extract_structured_data(text)
             
@@ -296,8 +301,8 @@ class OCRProcessor:
                 'raw_text': text,
                 'structured_data': structured_data,
                 'extraction_confidence': self.calculate_confidence(structured_data),
-                'processed_at': pd.Timestamp.now().isoformat(),
-                'file_name': file_path.split('/')[-1]
+                'processed_at': datetime.now().isoformat(),
+                'file_name': os.path.basename(file_path)
             }
             
             logger.info(f"Successfully processed document: {file_path}")
@@ -310,36 +315,40 @@ class OCRProcessor:
     def calculate_confidence(self, data: Dict) -> float:
         """Calculate extraction confidence based on fields found"""
         try:
-            total_fields = len(self.patterns)
-            extracted_fields = len(data)
-            
             # Base confidence
-            confidence = (extracted_fields / total_fields) * 100
+            confidence = (len(data) / self._total_patterns) * 100
             
-            # Boost confidence for critical fields
-            critical_fields = ['name', 'village', 'district']
-            critical_found = sum(1 for field in critical_fields if field in data)
-            confidence += (critical_found / len(critical_fields)) * 20
+            # Boost confidence for critical fields - one C-level set
+            # intersection instead of a membership generator
+            critical_found = len(self._critical_fields & data.keys())
+            confidence += (critical_found / len(self._critical_fields)) * 20
             
             return min(confidence, 100.0)
             
         except:
             return 0.0
     
-    def batch_process(self, file_paths: List[str]) -> List[Dict]:
-        """Process multiple documents"""
-        results = []
-        
-        for file_path in file_paths:
-            try:
-                result = self.process_document(file_path)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error processing {file_path}: {str(e)}")
-                results.append({
-                    'file_name': file_path.split('/')[-1],
-                    'error': str(e),
-                    'processed_at': pd.Timestamp.now().isoformat()
-                })
+    def batch_process(self, file_paths: List[str], workers: int = None) -> List[Dict]:
+        """Process multiple documents
+
+        Documents are independent, so multi-file batches fan out across
+        worker processes (Tesseract is CPU-bound); single files stay
+        in-process to skip the pool startup cost.
+        """
+        if len(file_paths) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(self.process_document_safe, file_paths))
         
-        return results
\ No newline at end of file
+        return [self.process_document_safe(file_path) for file_path in file_paths]
+    
+    def process_document_safe(self, file_path: str) -> Dict:
+        """Process one document, returning an error record on failure"""
+        try:
+            return self.process_document(file_path)
+        except Exception as e:
+            logger.error(f"Error processing {file_path}: {str(e)}")
+            return {
+                'file_name': os.path.basename(file_path),
+                'error': str(e),
+                'processed_at': datetime.now().isoformat()
+            }
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""
+WSGI Entry Point
+Production deployment for the FRA Atlas application
+
+The dev server in app.py serializes every request on one thread; in
+production run this module under gunicorn instead:
+
+    gunicorn -w 4 -k gevent --bind 0.0.0.0:5000 wsgi:application
+"""
+
+import logging
+
+from app import app, data_manager
+
+logger = logging.getLogger(__name__)
+
+# Initialize data when the worker boots
+try:
+    data_manager.initialize_data()
+    logger.info("Data initialization completed successfully")
+except Exception as e:
+    logger.error(f"Error initializing data: {str(e)}")
+
+application = app